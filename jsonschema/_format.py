@@ -98,7 +98,7 @@ class FormatChecker(object):
             cause = e
         if not result:
             raise FormatError(
-                "%r is not a %r" % (instance, format), cause=cause,
+                "%r is not a %r", cause=cause, message_args=(instance, format),
             )
 
     def conforms(self, instance, format):
@@ -0,0 +1,320 @@
+"""
+Boolean counterparts of the keyword functions in :mod:`jsonschema._validators`.
+
+Each takes the same arguments as the validator function of the same name, but
+rather than yielding errors simply returns whether the instance is valid,
+stopping at the first failure without constructing any error objects.
+
+"""
+
+from jsonschema import _utils
+from jsonschema.compat import iteritems, zip
+
+
+def patternProperties(validator, patternProperties, instance, schema):
+    if not patternProperties or not validator.is_type(instance, "object"):
+        return True
+
+    for pattern, subschema in iteritems(patternProperties):
+        search = validator._regex(pattern).search
+        for k, v in iteritems(instance):
+            if search(k) and not validator.is_valid(v, subschema):
+                return False
+    return True
+
+
+def additionalProperties(validator, aP, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    known = validator._precompute(_utils.known_properties, schema)
+    if validator.is_type(aP, "object"):
+        return all(
+            validator.is_valid(instance[extra], aP)
+            for extra in known.extras(instance)
+        )
+    return bool(aP) or not known.has_extras(instance)
+
+
+def items(validator, items, instance, schema):
+    if not validator.is_type(instance, "array"):
+        return True
+
+    if validator.is_type(items, "object"):
+        return all(validator.is_valid(item, items) for item in instance)
+    return all(
+        validator.is_valid(item, subschema)
+        for item, subschema in zip(instance, items)
+    )
+
+
+def additionalItems(validator, aI, instance, schema):
+    if (
+        not validator.is_type(instance, "array") or
+        validator.is_type(schema.get("items", {}), "object")
+    ):
+        return True
+
+    len_items = len(schema.get("items", []))
+    if validator.is_type(aI, "object"):
+        return all(
+            validator.is_valid(item, aI) for item in instance[len_items:]
+        )
+    return bool(aI) or len(instance) <= len_items
+
+
+def minimum(validator, minimum, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+
+    if schema.get("exclusiveMinimum", False):
+        failed = instance <= minimum
+    else:
+        failed = instance < minimum
+    return not failed
+
+
+def maximum(validator, maximum, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+
+    if schema.get("exclusiveMaximum", False):
+        failed = instance >= maximum
+    else:
+        failed = instance > maximum
+    return not failed
+
+
+def multipleOf(validator, dB, instance, schema):
+    if not validator.is_type(instance, "number"):
+        return True
+
+    if isinstance(dB, float):
+        quotient = instance / dB
+        failed = int(quotient) != quotient
+    else:
+        failed = instance % dB
+    return not failed
+
+
+def minItems(validator, mI, instance, schema):
+    return not validator.is_type(instance, "array") or len(instance) >= mI
+
+
+def maxItems(validator, mI, instance, schema):
+    return not validator.is_type(instance, "array") or len(instance) <= mI
+
+
+def uniqueItems(validator, uI, instance, schema):
+    return (
+        not uI or
+        not validator.is_type(instance, "array") or
+        _utils.uniq(instance)
+    )
+
+
+def pattern(validator, patrn, instance, schema):
+    return (
+        not validator.is_type(instance, "string") or
+        validator._regex(patrn).search(instance) is not None
+    )
+
+
+def format(validator, format, instance, schema):
+    return (
+        validator.format_checker is None or
+        validator.format_checker.conforms(instance, format)
+    )
+
+
+def minLength(validator, mL, instance, schema):
+    return not validator.is_type(instance, "string") or len(instance) >= mL
+
+
+def maxLength(validator, mL, instance, schema):
+    return not validator.is_type(instance, "string") or len(instance) <= mL
+
+
+def dependencies(validator, dependencies, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    for property, dependency in iteritems(dependencies):
+        if property not in instance:
+            continue
+
+        if validator.is_type(dependency, "object"):
+            if not validator.is_valid(instance, dependency):
+                return False
+        else:
+            dependencies = _utils.ensure_list(dependency)
+            for dependency in dependencies:
+                if dependency not in instance:
+                    return False
+    return True
+
+
+def enum(validator, enums, instance, schema):
+    return _utils.in_enum(validator, enums, instance)
+
+
+def ref(validator, ref, instance, schema):
+    resolve = getattr(validator.resolver, "resolve", None)
+    if resolve is None:
+        with validator.resolver.resolving(ref) as resolved:
+            return validator.is_valid(instance, resolved)
+    else:
+        scope, resolved = validator.resolver.resolve(ref)
+        validator.resolver.push_scope(scope)
+
+        try:
+            return validator.is_valid(instance, resolved)
+        finally:
+            validator.resolver.pop_scope()
+
+
+def type_draft3(validator, types, instance, schema):
+    types = _utils.ensure_list(types)
+
+    for type in types:
+        if type == "any":
+            return True
+        if validator.is_type(type, "object"):
+            if validator.is_valid(instance, type):
+                return True
+        elif validator.is_type(instance, type):
+            return True
+    return False
+
+
+def properties_draft3(validator, properties, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    for property, subschema in iteritems(properties):
+        if property in instance:
+            if not validator.is_valid(instance[property], subschema):
+                return False
+        elif subschema.get("required", False):
+            return False
+    return True
+
+
+def disallow_draft3(validator, disallow, instance, schema):
+    return not any(
+        type_draft3(validator, [disallowed], instance, schema)
+        for disallowed in _utils.ensure_list(disallow)
+    )
+
+
+def extends_draft3(validator, extends, instance, schema):
+    if validator.is_type(extends, "object"):
+        return validator.is_valid(instance, extends)
+    return all(validator.is_valid(instance, each) for each in extends)
+
+
+def type_draft4(validator, types, instance, schema):
+    types = _utils.ensure_list(types)
+    return any(validator.is_type(instance, type) for type in types)
+
+
+def properties_draft4(validator, properties, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+
+    return all(
+        validator.is_valid(instance[property], subschema)
+        for property, subschema in iteritems(properties)
+        if property in instance
+    )
+
+
+def required_draft4(validator, required, instance, schema):
+    if not validator.is_type(instance, "object"):
+        return True
+    return all(property in instance for property in required)
+
+
+def minProperties_draft4(validator, mP, instance, schema):
+    return not validator.is_type(instance, "object") or len(instance) >= mP
+
+
+def maxProperties_draft4(validator, mP, instance, schema):
+    return not validator.is_type(instance, "object") or len(instance) <= mP
+
+
+def allOf_draft4(validator, allOf, instance, schema):
+    return all(validator.is_valid(instance, each) for each in allOf)
+
+
+def oneOf_draft4(validator, oneOf, instance, schema):
+    subschemas = iter(oneOf)
+    if not any(validator.is_valid(instance, each) for each in subschemas):
+        return False
+    return not any(validator.is_valid(instance, each) for each in subschemas)
+
+
+def anyOf_draft4(validator, anyOf, instance, schema):
+    return any(validator.is_valid(instance, each) for each in anyOf)
+
+
+def not_draft4(validator, not_schema, instance, schema):
+    return not validator.is_valid(instance, not_schema)
+
+
+def object_properties(validator, keywords, instance, schema):
+    """
+    Check whichever of ``properties``, ``patternProperties`` and
+    ``additionalProperties`` are in ``keywords`` at once.
+
+    Rather than each of them looking at each property of the instance, each
+    property is looked at only once and checked against whichever of their
+    subschemas apply to it. Compiled validators use this in place of each
+    keyword's own predicate. There is no counterpart which finds errors.
+
+    """
+
+    if not validator.is_type(instance, "object"):
+        return True
+
+    known = validator._precompute(_utils.known_properties, schema)
+    if u"properties" in keywords:
+        properties = known.properties
+    else:
+        properties = {}
+    search, patterns = known.search, known.patterns
+    if u"patternProperties" not in keywords:
+        patterns = ()
+
+    aP = True
+    if u"additionalProperties" in keywords:
+        aP = schema[u"additionalProperties"]
+        if validator.is_type(aP, "object"):
+            pass
+        elif aP:
+            aP = True
+        elif search is None and len(instance) > len(known.properties):
+            return False
+        else:
+            aP = False
+
+    for property, value in iteritems(instance):
+        subschema = properties.get(property)
+        if subschema is not None and not validator.is_valid(value, subschema):
+            return False
+
+        for pattern_search, subschema in patterns:
+            if (
+                pattern_search(property) and
+                not validator.is_valid(value, subschema)
+            ):
+                return False
+
+        if (
+            aP is not True and
+            property not in known.properties and
+            (search is None or search(property) is None)
+        ):
+            if aP is False or not validator.is_valid(value, aP):
+                return False
+    return True
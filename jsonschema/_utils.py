@@ -1,9 +1,47 @@
-import itertools
+from collections import OrderedDict
 import json
 import pkgutil
-import re
+import threading
 
-from jsonschema.compat import str_types, MutableMapping, urlsplit
+from jsonschema.compat import (
+    MutableMapping, iteritems, lru_cache, str_types, unquote, urlsplit,
+)
+
+
+@lru_cache(maxsize=4096)
+def normalize_uri(uri):
+    """
+    Normalize a URI, remembering the results for the most recent URIs.
+
+    """
+
+    return urlsplit(uri).geturl()
+
+
+@lru_cache(maxsize=1024)
+def parse_pointer(fragment):
+    """
+    Split a JSON pointer (URI fragment) into its decoded reference tokens.
+
+    Returns:
+
+        tuple: ``(token, index)`` pairs, where ``index`` is the token as an
+        :class:`int` (for use on arrays), or ``None`` if it is not one
+
+    """
+
+    fragment = fragment.lstrip(u"/")
+    parts = unquote(fragment).split(u"/") if fragment else []
+
+    pointer = []
+    for part in parts:
+        part = part.replace(u"~1", u"/").replace(u"~0", u"~")
+        try:
+            index = int(part)
+        except ValueError:
+            index = None
+        pointer.append((part, index))
+    return tuple(pointer)
 
 
 class URIDict(MutableMapping):
@@ -13,14 +51,18 @@ class URIDict(MutableMapping):
     """
 
     def normalize(self, uri):
-        return urlsplit(uri).geturl()
+        return normalize_uri(uri)
 
     def __init__(self, *args, **kwargs):
         self.store = dict()
         self.store.update(*args, **kwargs)
 
     def __getitem__(self, uri):
-        return self.store[self.normalize(uri)]
+        # Keys are stored normalized, so a URI found as is needs no work.
+        try:
+            return self.store[uri]
+        except KeyError:
+            return self.store[self.normalize(uri)]
 
     def __setitem__(self, uri, value):
         self.store[self.normalize(uri)] = value
@@ -37,6 +79,68 @@ class URIDict(MutableMapping):
     def __repr__(self):
         return repr(self.store)
 
+    def update(self, other=(), **kwargs):
+        """
+        Update from another mapping, which if it is also a :class:`URIDict`
+        is trusted to have normalized keys already.
+
+        """
+
+        if isinstance(other, URIDict) and not kwargs:
+            self.store.update(iteritems(other))
+        else:
+            super(URIDict, self).update(other, **kwargs)
+
+
+class LayeredURIDict(URIDict):
+    """
+    A :class:`URIDict` layered over a base mapping of normalized URIs.
+
+    Lookups fall back to the base, which is shared and never modified;
+    changes are made only to this dictionary's own layer, and the base is
+    only copied into it if one of its items is deleted.
+
+    """
+
+    def __init__(self, base):
+        super(LayeredURIDict, self).__init__()
+        self.base = base
+
+    def __getitem__(self, uri):
+        store, base = self.store, self.base
+        if uri in store:
+            return store[uri]
+        elif uri in base:
+            return base[uri]
+
+        uri = self.normalize(uri)
+        try:
+            return store[uri]
+        except KeyError:
+            return base[uri]
+
+    def __delitem__(self, uri):
+        if self.normalize(uri) in self.base:
+            base, self.base = self.base, {}
+            for each, value in iteritems(base):
+                self.store.setdefault(each, value)
+        super(LayeredURIDict, self).__delitem__(uri)
+
+    def __iter__(self):
+        for uri in self.store:
+            yield uri
+        for uri in self.base:
+            if uri not in self.store:
+                yield uri
+
+    def __len__(self):
+        return len(self.store) + sum(
+            1 for uri in self.base if uri not in self.store
+        )
+
+    def __repr__(self):
+        return repr(dict(iteritems(self)))
+
 
 class Unset(object):
     """
@@ -48,6 +152,64 @@ class Unset(object):
         return "<unset>"
 
 
+class LRUCache(object):
+    """
+    A thread-safe mapping holding at most ``maxsize`` of its most recently
+    used items (or all of them, if ``maxsize`` is ``None``).
+
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            value = self._items[key] = self._items.pop(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            if self.maxsize is None:
+                return
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def values(self):
+        with self._lock:
+            return list(self._items.values())
+
+    def __len__(self):
+        return len(self._items)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+def fingerprint(schema):
+    """
+    Return a string which changes whenever the contents of ``schema`` do.
+
+    Returns ``None`` if ``schema`` contains something which is not JSON.
+
+    """
+
+    try:
+        return json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
 def load_schema(name):
     """
     Load a schema from ./schemas/``name``.json and return it.
@@ -86,29 +248,118 @@ def format_as_index(indices):
     return "[%s]" % "][".join(repr(index) for index in indices)
 
 
-def find_additional_properties(instance, schema):
+class KnownProperties(object):
+    """
+    The properties known to a schema.
+
+    Known properties are those which are validated by ``properties`` and / or
+    ``patternProperties``, with all of the latter combined into one regex.
+
+    Instances are callable, checking whether a single property is known.
+    ``patterns`` holds a ``(search, subschema)`` pair for each pattern.
+
+    """
+
+    def __init__(self, properties, search=None, patterns=()):
+        self.properties = properties
+        self.search = search
+        self.patterns = patterns
+
+    def __call__(self, property):
+        if property in self.properties:
+            return True
+        return self.search is not None and self.search(property) is not None
+
+    def extras(self, instance):
+        """
+        Lazily iterate over the properties of ``instance`` which aren't known.
+
+        """
+
+        properties, search = self.properties, self.search
+        if search is None:
+            return (each for each in instance if each not in properties)
+        return (
+            each for each in instance
+            if each not in properties and search(each) is None
+        )
+
+    def has_extras(self, instance):
+        """
+        Check whether ``instance`` has any property which is not known.
+
+        Stops at the first such property, and without ``patternProperties``
+        doesn't look at any of them if there are more than there are known.
+
+        """
+
+        if self.search is None and len(instance) > len(self.properties):
+            return True
+        for _ in self.extras(instance):
+            return True
+        return False
+
+
+def known_properties(validator, schema):
+    """
+    Return the :class:`KnownProperties` of ``schema``.
+
+    """
+
+    properties = schema.get("properties", {})
+    patternProperties = schema.get("patternProperties", {})
+    if not patternProperties:
+        return KnownProperties(properties)
+    # The combined regex is only compiled once something looks for extras,
+    # since patternProperties itself matches each of its patterns separately.
+    combined = "|".join(patternProperties)
+
+    def search(property):
+        return validator._regex(combined).search(property)
+
+    return KnownProperties(
+        properties,
+        search=search,
+        patterns=[
+            (validator._regex(pattern).search, subschema)
+            for pattern, subschema in iteritems(patternProperties)
+        ],
+    )
+
+
+def find_additional_properties(instance, is_known):
     """
     Return the set of additional properties for the given ``instance``.
 
     Weeds out properties that should have been validated by ``properties`` and
-    / or ``patternProperties``.
+    / or ``patternProperties``, as determined by ``is_known`` (see
+    :func:`known_properties`).
 
     Assumes ``instance`` is dict-like already.
 
     """
 
-    properties = schema.get("properties", {})
-    patterns = "|".join(schema.get("patternProperties", {}))
     for property in instance:
-        if property not in properties:
-            if patterns and re.search(patterns, property):
-                continue
+        if not is_known(property):
             yield property
 
 
+class Reprs(object):
+    """
+    The comma separated reprs of some things, rendered only when needed.
+
+    """
+
+    def __init__(self, things):
+        self.things = things
+
+    def __str__(self):
+        return ", ".join(repr(thing) for thing in self.things)
+
+
 def extras_msg(extras):
     """
-    Create an error message for extra items or properties.
+    Create the arguments for an error message for extra items or properties.
 
     """
 
@@ -116,7 +367,7 @@ def extras_msg(extras):
         verb = "was"
     else:
         verb = "were"
-    return ", ".join(repr(extra) for extra in extras), verb
+    return Reprs(extras), verb
 
 
 def types_msg(instance, types):
@@ -128,15 +379,17 @@ def types_msg(instance, types):
 
     Otherwise the message is simply the reprs of the given ``types``.
 
+    Returns the message along with the arguments to interpolate into it.
+
     """
 
-    reprs = []
+    names = []
     for type in types:
         try:
-            reprs.append(repr(type["name"]))
+            names.append(type["name"])
         except Exception:
-            reprs.append(repr(type))
-    return "%r is not of type %s" % (instance, ", ".join(reprs))
+            names.append(type)
+    return "%r is not of type %s", (instance, Reprs(names))
 
 
 def flatten(suitable_for_isinstance):
@@ -188,30 +441,124 @@ def unbool(element, true=object(), false=object()):
     return element
 
 
-def uniq(container):
+_ARRAY, _OBJECT = object(), object()
+
+
+def canonical(thing):
     """
-    Check if all of a container's elements are unique.
+    Return a hashable form of the (deserialized JSON) ``thing``.
 
-    Successively tries first to rely that the elements are hashable, then
-    falls back on them being sortable, and finally falls back on brute
-    force.
+    Two things have equal canonical forms if and only if they are equal as
+    JSON, so e.g. ``1`` and ``1.0`` are, but ``True`` and ``1`` are not.
+    Hashing the result raises :exc:`TypeError` if ``thing`` contains some
+    other unhashable object.
 
     """
 
+    if isinstance(thing, dict):
+        return _OBJECT, frozenset(
+            (key, canonical(value)) for key, value in iteritems(thing)
+        )
+    elif isinstance(thing, list):
+        return _ARRAY, tuple(canonical(each) for each in thing)
+    return unbool(thing)
+
+
+def enum_members(validator, enums):
+    """
+    Return the set of canonical forms of ``enums``.
+
+    Returns ``None`` if they can't all be hashed (or if ``enums`` isn't an
+    array at all), in which case they must be searched through instead.
+
+    """
+
+    if not isinstance(enums, list):
+        return None
     try:
-        return len(set(unbool(i) for i in container)) == len(container)
+        return frozenset(canonical(each) for each in enums)
     except TypeError:
-        try:
-            sort = sorted(unbool(i) for i in container)
-            sliced = itertools.islice(sort, 1, None)
-            for i, j in zip(sort, sliced):
-                if i == j:
-                    return False
-        except (NotImplementedError, TypeError):
-            seen = []
-            for e in container:
-                e = unbool(e)
-                if e in seen:
-                    return False
-                seen.append(e)
-    return True
+        return None
+
+
+def in_enum(validator, enums, instance):
+    """
+    Check whether ``instance`` is one of ``enums``.
+
+    Compiled validators index ``enums`` (once), while others search through
+    it, since indexing it takes longer than a single search.
+
+    """
+
+    if validator._precomputed is not None:
+        members = validator._precompute(enum_members, enums)
+        if members is not None:
+            try:
+                return canonical(instance) in members
+            except TypeError:
+                pass
+
+    # Python equality is looser than JSON equality (True == 1, [True] == [1]),
+    # but only for booleans, things equal to them, and containers.
+    if (
+        not isinstance(instance, (bool, dict, list)) and
+        instance not in (0, 1)
+    ):
+        return instance in enums
+
+    try:
+        found = canonical(instance)
+        return any(
+            canonical(each) == found for each in enums if each == instance
+        )
+    except TypeError:
+        return instance in enums
+
+
+def find_duplicate(container):
+    """
+    Find the first pair of elements of ``container`` which are equal as JSON.
+
+    Elements are hashed by their :func:`canonical` form, falling back to
+    comparing each pair of them if some are unhashable.
+
+    Returns:
+
+        tuple: the indices of the first element which is equal to an earlier
+        one and of that earlier element (in ascending order), or ``None`` if
+        all elements are unique
+
+    """
+
+    # Most arrays hold hashable scalars, whose canonical forms are unbool's,
+    # so the indices only need finding if this finds a duplicate.
+    try:
+        if len(set(unbool(each) for each in container)) == len(container):
+            return None
+    except TypeError:
+        pass
+
+    seen = {}
+    try:
+        for index, element in enumerate(container):
+            first = seen.setdefault(canonical(element), index)
+            if first != index:
+                return first, index
+    except TypeError:
+        seen = []
+        for index, element in enumerate(container):
+            element = unbool(element)
+            for first, other in enumerate(seen):
+                if other == element:
+                    return first, index
+            seen.append(element)
+    return None
+
+
+def uniq(container):
+    """
+    Check if all of a container's elements are unique.
+
+    """
+
+    return find_duplicate(container) is None
@@ -1,17 +1,18 @@
-import re
+import itertools
 
-from jsonschema import _utils
+from jsonschema import _predicates, _utils
 from jsonschema.exceptions import FormatError, ValidationError
 from jsonschema.compat import iteritems
 
 
 def patternProperties(validator, patternProperties, instance, schema):
-    if not validator.is_type(instance, "object"):
+    if not patternProperties or not validator.is_type(instance, "object"):
         return
 
     for pattern, subschema in iteritems(patternProperties):
+        search = validator._regex(pattern).search
         for k, v in iteritems(instance):
-            if re.search(pattern, k):
+            if search(k):
                 for error in validator.descend(
                     v, subschema, path=k, schema_path=pattern,
                 ):
@@ -22,28 +23,37 @@ def additionalProperties(validator, aP, instance, schema):
     if not validator.is_type(instance, "object"):
         return
 
-    extras = set(_utils.find_additional_properties(instance, schema))
+    known = validator._precompute(_utils.known_properties, schema)
+    extras = known.extras(instance)
 
     if validator.is_type(aP, "object"):
-        for extra in extras:
+        for extra in set(extras):
             for error in validator.descend(instance[extra], aP, path=extra):
                 yield error
-    elif not aP and extras:
+        return
+    elif aP:
+        return
+
+    # Every extra is reported in one error, which lists at most max_errors.
+    extras = set(_limited(validator, extras))
+    if extras:
         if "patternProperties" in schema:
             patterns = sorted(schema["patternProperties"])
             if len(extras) == 1:
                 verb = "does"
             else:
                 verb = "do"
-            error = "%s %s not match any of the regexes: %s" % (
-                ", ".join(map(repr, sorted(extras))),
-                verb,
-                ", ".join(map(repr, patterns)),
+            yield ValidationError(
+                "%s %s not match any of the regexes: %s",
+                message_args=(
+                    _utils.Reprs(sorted(extras)), verb, _utils.Reprs(patterns),
+                ),
             )
-            yield ValidationError(error)
         else:
             error = "Additional properties are not allowed (%s %s unexpected)"
-            yield ValidationError(error % _utils.extras_msg(extras))
+            yield ValidationError(
+                error, message_args=_utils.extras_msg(extras),
+            )
 
 
 def items(validator, items, instance, schema):
@@ -77,8 +87,10 @@ def additionalItems(validator, aI, instance, schema):
     elif not aI and len(instance) > len(schema.get("items", [])):
         error = "Additional items are not allowed (%s %s unexpected)"
         yield ValidationError(
-            error %
-            _utils.extras_msg(instance[len(schema.get("items", [])):])
+            error,
+            message_args=_utils.extras_msg(
+                instance[len(schema.get("items", [])):],
+            ),
         )
 
 
@@ -95,7 +107,8 @@ def minimum(validator, minimum, instance, schema):
 
     if failed:
         yield ValidationError(
-            "%r is %s the minimum of %r" % (instance, cmp, minimum)
+            "%r is %s the minimum of %r",
+            message_args=(instance, cmp, minimum),
         )
 
 
@@ -112,7 +125,8 @@ def maximum(validator, maximum, instance, schema):
 
     if failed:
         yield ValidationError(
-            "%r is %s the maximum of %r" % (instance, cmp, maximum)
+            "%r is %s the maximum of %r",
+            message_args=(instance, cmp, maximum),
         )
 
 
@@ -127,34 +141,41 @@ def multipleOf(validator, dB, instance, schema):
         failed = instance % dB
 
     if failed:
-        yield ValidationError("%r is not a multiple of %r" % (instance, dB))
+        yield ValidationError(
+            "%r is not a multiple of %r", message_args=(instance, dB),
+        )
 
 
 def minItems(validator, mI, instance, schema):
     if validator.is_type(instance, "array") and len(instance) < mI:
-        yield ValidationError("%r is too short" % (instance,))
+        yield ValidationError("%r is too short", message_args=(instance,))
 
 
 def maxItems(validator, mI, instance, schema):
     if validator.is_type(instance, "array") and len(instance) > mI:
-        yield ValidationError("%r is too long" % (instance,))
+        yield ValidationError("%r is too long", message_args=(instance,))
 
 
 def uniqueItems(validator, uI, instance, schema):
-    if (
-        uI and
-        validator.is_type(instance, "array") and
-        not _utils.uniq(instance)
-    ):
-        yield ValidationError("%r has non-unique elements" % (instance,))
+    if not uI or not validator.is_type(instance, "array"):
+        return
+
+    duplicate = _utils.find_duplicate(instance)
+    if duplicate is not None:
+        yield ValidationError(
+            "%r has non-unique elements (items %r and %r are equal)",
+            message_args=(instance,) + duplicate,
+        )
 
 
 def pattern(validator, patrn, instance, schema):
     if (
         validator.is_type(instance, "string") and
-        not re.search(patrn, instance)
+        not validator._regex(patrn).search(instance)
     ):
-        yield ValidationError("%r does not match %r" % (instance, patrn))
+        yield ValidationError(
+            "%r does not match %r", message_args=(instance, patrn),
+        )
 
 
 def format(validator, format, instance, schema):
@@ -162,17 +183,21 @@ def format(validator, format, instance, schema):
         try:
             validator.format_checker.check(instance, format)
         except FormatError as error:
-            yield ValidationError(error.message, cause=error.cause)
+            yield ValidationError(
+                error._message,
+                cause=error.cause,
+                message_args=error._message_args,
+            )
 
 
 def minLength(validator, mL, instance, schema):
     if validator.is_type(instance, "string") and len(instance) < mL:
-        yield ValidationError("%r is too short" % (instance,))
+        yield ValidationError("%r is too short", message_args=(instance,))
 
 
 def maxLength(validator, mL, instance, schema):
     if validator.is_type(instance, "string") and len(instance) > mL:
-        yield ValidationError("%r is too long" % (instance,))
+        yield ValidationError("%r is too long", message_args=(instance,))
 
 
 def dependencies(validator, dependencies, instance, schema):
@@ -193,13 +218,16 @@ def dependencies(validator, dependencies, instance, schema):
             for dependency in dependencies:
                 if dependency not in instance:
                     yield ValidationError(
-                        "%r is a dependency of %r" % (dependency, property)
+                        "%r is a dependency of %r",
+                        message_args=(dependency, property),
                     )
 
 
 def enum(validator, enums, instance, schema):
-    if instance not in enums:
-        yield ValidationError("%r is not one of %r" % (instance, enums))
+    if not _utils.in_enum(validator, enums, instance):
+        yield ValidationError(
+            "%r is not one of %r", message_args=(instance, enums),
+        )
 
 
 def ref(validator, ref, instance, schema):
@@ -221,23 +249,19 @@ def ref(validator, ref, instance, schema):
 
 def type_draft3(validator, types, instance, schema):
     types = _utils.ensure_list(types)
+    if _predicates.type_draft3(validator, types, instance, schema):
+        return
 
-    all_errors = []
-    for index, type in enumerate(types):
-        if type == "any":
-            return
-        if validator.is_type(type, "object"):
-            errors = list(validator.descend(instance, type, schema_path=index))
-            if not errors:
-                return
-            all_errors.extend(errors)
-        else:
-            if validator.is_type(instance, type):
-                return
-    else:
-        yield ValidationError(
-            _utils.types_msg(instance, types), context=all_errors,
-        )
+    all_errors = _context(
+        validator,
+        (
+            validator.descend(instance, type, schema_path=index)
+            for index, type in enumerate(types)
+            if validator.is_type(type, "object")
+        ),
+    )
+    message, args = _utils.types_msg(instance, types)
+    yield ValidationError(message, message_args=args, context=all_errors)
 
 
 def properties_draft3(validator, properties, instance, schema):
@@ -254,7 +278,9 @@ def properties_draft3(validator, properties, instance, schema):
             ):
                 yield error
         elif subschema.get("required", False):
-            error = ValidationError("%r is a required property" % property)
+            error = ValidationError(
+                "%r is a required property", message_args=(property,),
+            )
             error._set(
                 validator="required",
                 validator_value=subschema["required"],
@@ -268,9 +294,10 @@ def properties_draft3(validator, properties, instance, schema):
 
 def disallow_draft3(validator, disallow, instance, schema):
     for disallowed in _utils.ensure_list(disallow):
-        if validator.is_valid(instance, {"type": [disallowed]}):
+        if _predicates.type_draft3(validator, [disallowed], instance, schema):
             yield ValidationError(
-                "%r is disallowed for %r" % (disallowed, instance)
+                "%r is disallowed for %r",
+                message_args=(disallowed, instance),
             )
 
 
@@ -288,7 +315,8 @@ def type_draft4(validator, types, instance, schema):
     types = _utils.ensure_list(types)
 
     if not any(validator.is_type(instance, type) for type in types):
-        yield ValidationError(_utils.types_msg(instance, types))
+        message, args = _utils.types_msg(instance, types)
+        yield ValidationError(message, message_args=args)
 
 
 def properties_draft4(validator, properties, instance, schema):
@@ -311,13 +339,15 @@ def required_draft4(validator, required, instance, schema):
         return
     for property in required:
         if property not in instance:
-            yield ValidationError("%r is a required property" % property)
+            yield ValidationError(
+                "%r is a required property", message_args=(property,),
+            )
 
 
 def minProperties_draft4(validator, mP, instance, schema):
     if validator.is_type(instance, "object") and len(instance) < mP:
         yield ValidationError(
-            "%r does not have enough properties" % (instance,)
+            "%r does not have enough properties", message_args=(instance,),
         )
 
 
@@ -325,7 +355,9 @@ def maxProperties_draft4(validator, mP, instance, schema):
     if not validator.is_type(instance, "object"):
         return
     if validator.is_type(instance, "object") and len(instance) > mP:
-        yield ValidationError("%r has too many properties" % (instance,))
+        yield ValidationError(
+            "%r has too many properties", message_args=(instance,),
+        )
 
 
 def allOf_draft4(validator, allOf, instance, schema):
@@ -336,44 +368,75 @@ def allOf_draft4(validator, allOf, instance, schema):
 
 def oneOf_draft4(validator, oneOf, instance, schema):
     subschemas = enumerate(oneOf)
-    all_errors = []
     for index, subschema in subschemas:
-        errs = list(validator.descend(instance, subschema, schema_path=index))
-        if not errs:
+        if validator.is_valid(instance, subschema):
             first_valid = subschema
             break
-        all_errors.extend(errs)
     else:
+        all_errors = _context(
+            validator,
+            (
+                validator.descend(instance, subschema, schema_path=index)
+                for index, subschema in enumerate(oneOf)
+            ),
+        )
         yield ValidationError(
-            "%r is not valid under any of the given schemas" % (instance,),
+            "%r is not valid under any of the given schemas",
+            message_args=(instance,),
             context=all_errors,
         )
 
     more_valid = [s for i, s in subschemas if validator.is_valid(instance, s)]
     if more_valid:
         more_valid.append(first_valid)
-        reprs = ", ".join(repr(schema) for schema in more_valid)
         yield ValidationError(
-            "%r is valid under each of %s" % (instance, reprs)
+            "%r is valid under each of %s",
+            message_args=(instance, _utils.Reprs(more_valid)),
         )
 
 
 def anyOf_draft4(validator, anyOf, instance, schema):
-    all_errors = []
-    for index, subschema in enumerate(anyOf):
-        errs = list(validator.descend(instance, subschema, schema_path=index))
-        if not errs:
-            break
-        all_errors.extend(errs)
-    else:
-        yield ValidationError(
-            "%r is not valid under any of the given schemas" % (instance,),
-            context=all_errors,
-        )
+    if any(validator.is_valid(instance, subschema) for subschema in anyOf):
+        return
+
+    all_errors = _context(
+        validator,
+        (
+            validator.descend(instance, subschema, schema_path=index)
+            for index, subschema in enumerate(anyOf)
+        ),
+    )
+    yield ValidationError(
+        "%r is not valid under any of the given schemas",
+        message_args=(instance,),
+        context=all_errors,
+    )
 
 
 def not_draft4(validator, not_schema, instance, schema):
     if validator.is_valid(instance, not_schema):
         yield ValidationError(
-            "%r is not allowed for %r" % (not_schema, instance)
+            "%r is not allowed for %r", message_args=(not_schema, instance),
         )
+
+
+def _limited(validator, errors):
+    """
+    Stop ``errors`` after the validator's ``max_errors``, if it has one.
+
+    """
+
+    if validator.max_errors is None:
+        return errors
+    return itertools.islice(errors, validator.max_errors)
+
+
+def _context(validator, errors):
+    """
+    Collect each iterable of errors in ``errors`` for a combinator's context.
+
+    Contexts of validators with a ``max_errors`` hold at most that many.
+
+    """
+
+    return list(_limited(validator, itertools.chain.from_iterable(errors)))
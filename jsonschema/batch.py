@@ -0,0 +1,135 @@
+"""
+Validation of many independent instances in parallel worker processes.
+
+"""
+
+import multiprocessing
+
+from jsonschema.validators import RefResolver
+
+
+_validator = None
+_load = None
+
+
+def iter_errors(
+    validator,
+    instances,
+    workers=None,
+    chunksize=64,
+    ordered=True,
+    load=None,
+):
+    """
+    Lazily validate each of many instances using a pool of worker processes.
+
+    The schema, types, format checker, ``max_errors`` and
+    :attr:`RefResolver.store` of ``validator`` are sent to each worker once,
+    after which each worker validates the instances it is sent with its own
+    compiled copy of the validator. Instances are read from ``instances`` as
+    they are needed.
+
+    Arguments:
+
+        validator (:class:`IValidator`):
+
+            A validator (with a :class:`RefResolver`) whose schema each
+            instance should be validated under
+
+        instances (iterable):
+
+            The instances to validate
+
+        workers (int):
+
+            The number of worker processes to use. If unprovided, one per
+            CPU will be used
+
+        chunksize (int):
+
+            How many instances to send to a worker at a time
+
+        ordered (bool):
+
+            Whether results should be yielded in the same order as
+            ``instances``, or rather as soon as each is ready
+
+        load (callable):
+
+            If provided, a (picklable) callable which each worker will call
+            with each element of ``instances`` to produce the instance to
+            validate, e.g. to load it from a path. Any exception it raises
+            is re-raised when iterating over the results in place of the
+            result for the instance it failed to load
+
+    Returns:
+
+        an iterable of ``(index, errors)`` pairs, where ``errors`` is a
+        :class:`list` of the :exc:`ValidationError`\\s in the instance at
+        ``index`` in ``instances``
+
+    """
+
+    resolver = validator.resolver
+    pool = multiprocessing.Pool(
+        processes=workers,
+        initializer=_initialize,
+        initargs=(
+            type(validator),
+            validator.schema,
+            validator._types,
+            validator.format_checker,
+            validator.max_errors,
+            load,
+            dict(
+                base_uri=resolver.resolution_scope,
+                referrer=resolver.referrer,
+                store=resolver.store,
+                cache_remote=resolver.cache_remote,
+                handlers=resolver.handlers,
+                persistent_cache=resolver.persistent_cache,
+                timeout=resolver.timeout,
+                retries=resolver.retries,
+            ),
+        ),
+    )
+    try:
+        if ordered:
+            imap = pool.imap
+        else:
+            imap = pool.imap_unordered
+        for index, errors, error in imap(
+            _errors_in, enumerate(instances), chunksize=chunksize,
+        ):
+            if error is not None:
+                raise error
+            yield index, errors
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _initialize(
+    cls, schema, types, format_checker, max_errors, load, resolver,
+):
+    global _load, _validator
+    _load = load
+    _validator = cls(
+        schema,
+        types=types,
+        resolver=RefResolver(**resolver),
+        format_checker=format_checker,
+        max_errors=max_errors,
+    ).compile()
+
+
+def _errors_in(indexed_instance):
+    index, instance = indexed_instance
+    if _load is not None:
+        # Failures are returned rather than raised, since the pool would
+        # otherwise report them for the whole chunk containing the instance.
+        try:
+            instance = _load(instance)
+        except Exception as error:
+            return index, None, error
+    return index, list(_validator.iter_errors(instance)), None
@@ -22,4 +22,4 @@ collection = Collection(
 
 
 if __name__ == "__main__":
-    collection.benchmark(runner=Runner())
+    collection.benchmark(runner=Runner(), compiled=True)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+"""
+A performance benchmark for validating instances under large enums.
+
+Enums of thousands of codes (countries, currencies, SKUs, ...) are common.
+
+"""
+from perf import Runner
+
+import jsonschema
+
+
+codes = [u"C{0:05}".format(i) for i in range(5000)]
+records = [{u"code": code, u"quantity": i} for i, code in enumerate(codes)]
+
+schemas = {
+    "strings": ({u"enum": codes}, codes[-1]),
+    "numbers": ({u"enum": list(range(5000))}, 4999),
+    "objects": ({u"enum": records}, records[-1]),
+}
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    for name, (schema, instance) in sorted(schemas.items()):
+        validator = jsonschema.Draft4Validator(schema)
+        runner.bench_func(
+            "large enum of {0}".format(name), validator.is_valid, instance,
+        )
+        runner.bench_func(
+            "large enum of {0} (compiled)".format(name),
+            validator.compile().is_valid,
+            instance,
+        )
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+"""
+A microbenchmark for looking up documents in a :class:`RefResolver` store.
+
+"""
+from perf import Runner
+
+import jsonschema
+
+
+resolver = jsonschema.RefResolver("http://example.com/root.json", {})
+normalized = jsonschema.Draft4Validator.META_SCHEMA["id"].rstrip("#")
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    runner.bench_func(
+        "store lookup (normalized)", resolver.store.__getitem__, normalized,
+    )
+    runner.bench_func(
+        "store lookup (not normalized)",
+        resolver.store.__getitem__,
+        normalized + "#",
+    )
+    runner.bench_func(
+        "store lookup (missing)",
+        resolver.store.__contains__,
+        "http://example.com/missing.json",
+    )
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+"""
+A performance benchmark for the cost of creating a validator for a schema.
+
+Services which create a validator for each request pay this on every call.
+
+"""
+from perf import Runner
+
+import jsonschema
+
+
+schema = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "tags": {"type": "array", "items": {"$ref": "#/definitions/tag"}},
+    },
+    "definitions": {"tag": {"type": "string", "minLength": 1}},
+}
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    for cls in jsonschema.Draft3Validator, jsonschema.Draft4Validator:
+        runner.bench_func(
+            "{0} construction".format(cls.__name__), cls, schema,
+        )
+    runner.bench_func(
+        "RefResolver construction", jsonschema.RefResolver.from_schema, schema,
+    )
@@ -0,0 +1,106 @@
+"""
+Persistent caches of remote documents retrieved while resolving references.
+
+A cache is any object with ``get`` and ``set`` methods like those of
+:class:`DirectoryCache`, and may be passed to a :class:`RefResolver` as its
+``persistent_cache``.
+
+"""
+
+from collections import namedtuple
+import errno
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from jsonschema.compat import replace, urlsplit
+
+
+CachedDocument = namedtuple("CachedDocument", ["document", "etag", "fresh"])
+
+
+class DirectoryCache(object):
+    """
+    A cache which stores each document as a JSON file in a directory.
+
+    Files are named after a hash of the (normalized) URI of the document they
+    hold, and are written atomically, so a directory may be shared by many
+    processes.
+
+    Arguments:
+
+        path (str):
+
+            The directory to store documents in, which will be created if
+            it does not exist
+
+        ttl (float):
+
+            The number of seconds for which a document is considered fresh
+            after it was stored. Stale documents are revalidated using their
+            ``ETag`` if they have one, or otherwise retrieved again. If
+            unprovided, documents never become stale.
+
+    """
+
+    def __init__(self, path, ttl=None):
+        self.path = path
+        self.ttl = ttl
+
+    def __repr__(self):
+        return "<{0.__class__.__name__} {0.path!r}>".format(self)
+
+    def _path_for(self, uri):
+        uri = urlsplit(uri).geturl()
+        name = hashlib.sha256(uri.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, name + ".json")
+
+    def get(self, uri):
+        """
+        Look up the document at ``uri``.
+
+        Returns:
+
+            a :class:`CachedDocument`, or ``None`` if the document is not in
+            the cache
+
+        """
+
+        try:
+            with open(self._path_for(uri)) as file:
+                entry = json.load(file)
+            document, etag, stored = (
+                entry["document"], entry.get("etag"), entry["stored"],
+            )
+            fresh = self.ttl is None or time.time() - stored < self.ttl
+        except (IOError, OSError, ValueError, TypeError, KeyError):
+            # Unreadable files and ones that are not entries are misses.
+            return None
+
+        return CachedDocument(document=document, etag=etag, fresh=fresh)
+
+    def set(self, uri, document, etag=None):
+        """
+        Store the document retrieved from ``uri`` (along with its ``etag``).
+
+        """
+
+        try:
+            os.makedirs(self.path)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+
+        entry = dict(uri=uri, document=document, etag=etag, stored=time.time())
+        file = tempfile.NamedTemporaryFile(
+            mode="w", dir=self.path, suffix=".tmp", delete=False,
+        )
+        try:
+            with file:
+                json.dump(entry, file)
+            replace(file.name, self._path_for(uri))
+        except Exception:
+            os.remove(file.name)
+            raise
@@ -3,8 +3,10 @@ import argparse
 import json
 import sys
 
+from jsonschema import batch
 from jsonschema._reflect import namedAny
-from jsonschema.validators import validator_for
+from jsonschema.cache import DirectoryCache
+from jsonschema.validators import RefResolver, validator_for
 
 
 def _namedAnyWithDefault(name):
@@ -13,6 +15,15 @@ def _namedAnyWithDefault(name):
     return namedAny(name)
 
 
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            "%r is not a positive integer" % (value,),
+        )
+    return number
+
+
 def _json_file(path):
     with open(path) as file:
         return json.load(file)
@@ -25,12 +36,31 @@ parser.add_argument(
     "-i", "--instance",
     action="append",
     dest="instances",
-    type=_json_file,
     help=(
         "a path to a JSON instance (i.e. filename.json)"
         "to validate (may be specified multiple times)"
     ),
 )
+parser.add_argument(
+    "-j", "--jobs",
+    type=_positive_int,
+    help=(
+        "the number of worker processes to load and validate each "
+        "--instance in, rather than doing so one at a time in this process"
+    ),
+)
+parser.add_argument(
+    "--ndjson", "--stream",
+    action="append",
+    dest="streams",
+    metavar="PATH",
+    help=(
+        "a path to a file of newline-delimited JSON instances (or - for "
+        "stdin) to read and validate one line at a time, rather than all "
+        "at once (may be specified multiple times). Errors are prefixed "
+        "with the path and line number of the instance they are in"
+    ),
+)
 parser.add_argument(
     "-F", "--error-format",
     default="{error.instance}: {error.message}\n",
@@ -49,6 +79,25 @@ parser.add_argument(
         "of the class."
     ),
 )
+parser.add_argument(
+    "--max-errors",
+    type=_positive_int,
+    metavar="N",
+    help=(
+        "stop looking for errors in each instance once N have been found, "
+        "and collect at most N errors within each anyOf, oneOf or type "
+        "error, bounding the time spent on badly broken instances"
+    ),
+)
+parser.add_argument(
+    "--schema-cache",
+    metavar="DIR",
+    help=(
+        "a directory in which to keep any remote schemas that are retrieved "
+        "while resolving references, so that later runs do not retrieve "
+        "them again"
+    ),
+)
 parser.add_argument(
     "schema",
     help="the JSON Schema to validate with (i.e. filename.schema)",
@@ -58,6 +107,10 @@ parser.add_argument(
 
 def parse_args(args):
     arguments = vars(parser.parse_args(args=args or ["--help"]))
+    if arguments["instances"] and not arguments["jobs"]:
+        arguments["instances"] = [
+            _load_instance(path) for path in arguments["instances"]
+        ]
     if arguments["validator"] is None:
         arguments["validator"] = validator_for(arguments["schema"])
     return arguments
@@ -67,15 +120,113 @@ def main(args=sys.argv[1:]):
     sys.exit(run(arguments=parse_args(args=args)))
 
 
-def run(arguments, stdout=sys.stdout, stderr=sys.stderr):
+def run(
+    arguments, stdout=sys.stdout, stderr=sys.stderr, stdin=sys.stdin,
+):
     error_format = arguments["error_format"]
-    validator = arguments["validator"](schema=arguments["schema"])
+    options = {}
+    if arguments.get("schema_cache"):
+        options["resolver"] = RefResolver.from_schema(
+            arguments["schema"],
+            persistent_cache=DirectoryCache(arguments["schema_cache"]),
+        )
+    if arguments.get("max_errors") is not None:
+        options["max_errors"] = arguments["max_errors"]
+    validator = arguments["validator"](schema=arguments["schema"], **options)
 
     validator.check_schema(arguments["schema"])
 
     errored = False
-    for instance in arguments["instances"] or ():
+    if arguments.get("jobs"):
+        errored = _run_parallel(
+            validator,
+            arguments["instances"] or [],
+            arguments["jobs"],
+            error_format,
+            stderr,
+        )
+    else:
+        for instance in arguments["instances"] or ():
+            for error in validator.iter_errors(instance):
+                stderr.write(error_format.format(error=error))
+                errored = True
+
+    streams = arguments.get("streams")
+    if streams:
+        validator = validator.compile()
+        for path in streams:
+            if path == "-":
+                errored |= _run_stream(
+                    validator, "<stdin>", stdin, error_format, stderr,
+                )
+            else:
+                with open(path) as lines:
+                    errored |= _run_stream(
+                        validator, path, lines, error_format, stderr,
+                    )
+    return errored
+
+
+def _load_instance(path):
+    try:
+        return _json_file(path)
+    except ValueError:
+        _invalid_instance(path)
+
+
+def _invalid_instance(path):
+    parser.error(
+        "argument -i/--instance: invalid _json_file value: %r" % (path,),
+    )
+
+
+def _run_parallel(validator, paths, jobs, error_format, stderr):
+    """
+    Load and validate each of the instances at ``paths`` in worker processes.
+
+    Output is written only once every instance has been loaded, in the order
+    of ``paths``, so that it is the same as when validating serially.
+
+    """
+
+    results = batch.iter_errors(
+        validator, paths, workers=jobs, load=_json_file,
+    )
+    output = []
+    for path in paths:
+        # Results are in order, and a failure to load an instance is raised
+        # in place of its own result, so it belongs to this path.
+        try:
+            _, errors = next(results)
+        except ValueError:
+            _invalid_instance(path)
+        output.extend(error_format.format(error=error) for error in errors)
+
+    for each in output:
+        stderr.write(each)
+    return bool(output)
+
+
+def _run_stream(validator, path, lines, error_format, stderr):
+    """
+    Validate each newline-delimited JSON instance in ``lines`` as it is read.
+
+    """
+
+    errored = False
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        prefix = "{0}:{1}: ".format(path, number)
+        try:
+            instance = json.loads(line)
+        except ValueError as error:
+            stderr.write("{0}{1}\n".format(prefix, error))
+            errored = True
+            continue
+
         for error in validator.iter_errors(instance):
-            stderr.write(error_format.format(error=error))
+            stderr.write(prefix + error_format.format(error=error))
             errored = True
     return errored
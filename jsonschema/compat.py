@@ -13,9 +13,11 @@ if PY3:
     zip = zip
     from functools import lru_cache
     from io import StringIO
+    from os import replace
     from urllib.parse import (
         unquote, urljoin, urlunsplit, SplitResult, urlsplit as _urlsplit
     )
+    from urllib.error import HTTPError, URLError
     from urllib.request import urlopen
     str_types = str,
     int_types = int,
@@ -23,11 +25,12 @@ if PY3:
 else:
     from itertools import izip as zip  # noqa
     from StringIO import StringIO
+    from os import rename as replace  # noqa
     from urlparse import (
         urljoin, urlunsplit, SplitResult, urlsplit as _urlsplit # noqa
     )
     from urllib import unquote  # noqa
-    from urllib2 import urlopen  # noqa
+    from urllib2 import HTTPError, URLError, urlopen  # noqa
     str_types = basestring
     int_types = int, long
     iteritems = operator.methodcaller("iteritems")
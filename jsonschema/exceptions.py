@@ -26,6 +26,7 @@ class _Error(Exception):
         schema=_unset,
         schema_path=(),
         parent=None,
+        message_args=None,
     ):
         super(_Error, self).__init__(
             message,
@@ -38,8 +39,10 @@ class _Error(Exception):
             schema,
             schema_path,
             parent,
+            message_args,
         )
-        self.message = message
+        self._message = message
+        self._message_args = message_args
         self.path = self.relative_path = deque(path)
         self.schema_path = self.relative_schema_path = deque(schema_path)
         self.context = list(context)
@@ -56,6 +59,21 @@ class _Error(Exception):
     def __repr__(self):
         return "<%s: %r>" % (self.__class__.__name__, self.message)
 
+    @property
+    def message(self):
+        """
+        The error message, interpolating any ``message_args`` on access.
+
+        """
+
+        if self._message_args is None:
+            return self._message
+        return self._message % self._message_args
+
+    @message.setter
+    def message(self, message):
+        self._message, self._message_args = message, None
+
     def __unicode__(self):
         essential_for_verbose = (
             self.validator, self.validator_value, self.instance, self.schema,
@@ -89,6 +107,19 @@ class _Error(Exception):
         def __str__(self):
             return unicode(self).encode("utf-8")
 
+    def __reduce__(self):
+        # Only the message goes back through __init__, so that errors which
+        # refer to each other via context and parent can be pickled, and so
+        # that unset attributes stay unset.
+        state = dict(
+            (k, v) for k, v in iteritems(self.__dict__) if v is not _unset
+        )
+        return self.__class__, (self._message,), state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__cause__ = self.cause
+
     @classmethod
     def create_from(cls, other):
         return cls(**other._contents())
@@ -120,10 +151,12 @@ class _Error(Exception):
 
     def _contents(self):
         attrs = (
-            "message", "cause", "context", "validator", "validator_value",
+            "cause", "context", "validator", "validator_value",
             "path", "schema_path", "instance", "schema", "parent",
         )
-        return dict((attr, getattr(self, attr)) for attr in attrs)
+        contents = dict((attr, getattr(self, attr)) for attr in attrs)
+        contents.update(message=self._message, message_args=self._message_args)
+        return contents
 
 
 class ValidationError(_Error):
@@ -166,11 +199,27 @@ class UnknownType(Exception):
 
 
 class FormatError(Exception):
-    def __init__(self, message, cause=None):
-        super(FormatError, self).__init__(message, cause)
-        self.message = message
+    def __init__(self, message, cause=None, message_args=None):
+        super(FormatError, self).__init__(message, cause, message_args)
+        self._message = message
+        self._message_args = message_args
         self.cause = self.__cause__ = cause
 
+    @property
+    def message(self):
+        """
+        The error message, interpolating any ``message_args`` on access.
+
+        """
+
+        if self._message_args is None:
+            return self._message
+        return self._message % self._message_args
+
+    @message.setter
+    def message(self, message):
+        self._message, self._message_args = message, None
+
     def __unicode__(self):
         return self.message
 
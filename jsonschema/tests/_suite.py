@@ -73,12 +73,24 @@ class Collection(object):
     name = attr.ib()
     validator = attr.ib()
 
-    def benchmark(self, runner):
+    def benchmark(self, runner, compiled=False):
         for test in self.tests():
             runner.bench_func(
                 name=test.fully_qualified_name,
                 func=test.validate_ignoring_errors,
             )
+            if compiled:
+                validator = test.validator()
+                runner.bench_func(
+                    test.fully_qualified_name + " (is_valid)",
+                    validator.is_valid,
+                    test.data,
+                )
+                runner.bench_func(
+                    test.fully_qualified_name + " (is_valid, compiled)",
+                    validator.compile().is_valid,
+                    test.data,
+                )
 
     def tests(self):
         return (
@@ -164,15 +176,22 @@ class _Test(object):
         fn.__name__ = name
         return fn
 
-    def validate(self):
-        resolver = jsonschema.RefResolver.from_schema(
+    def _resolver(self):
+        return jsonschema.RefResolver.from_schema(
             schema=self.schema, store=self._remotes,
         )
+
+    def validator(self):
+        return self.collection.validator(
+            self.schema, resolver=self._resolver(), **self._validate_kwargs
+        )
+
+    def validate(self):
         jsonschema.validate(
             instance=self.data,
             schema=self.schema,
             cls=self.collection.validator,
-            resolver=resolver,
+            resolver=self._resolver(),
             **self._validate_kwargs
         )
 
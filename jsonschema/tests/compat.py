@@ -3,5 +3,10 @@ try:
 except ImportError:
     import mock
 
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
 
 # flake8: noqa
@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from jsonschema import Draft4Validator, FormatChecker, batch
+
+
+class TestIterErrors(TestCase):
+    schema = {
+        u"definitions": {u"small": {u"maximum": 3}},
+        u"items": {u"$ref": u"#/definitions/small"},
+        u"maxItems": 2,
+    }
+
+    def setUp(self):
+        self.validator = Draft4Validator(self.schema)
+        self.instances = [[1, 2], [1, 5], [4, 5, 6], []] * 10
+
+    def expected(self):
+        return [
+            (index, [error.message for error in errors])
+            for index, errors in enumerate(
+                list(self.validator.iter_errors(instance))
+                for instance in self.instances
+            )
+        ]
+
+    def messages(self, results):
+        return [
+            (index, [error.message for error in errors])
+            for index, errors in results
+        ]
+
+    def test_ordered(self):
+        results = batch.iter_errors(
+            self.validator, self.instances, workers=2, chunksize=3,
+        )
+        self.assertEqual(self.messages(results), self.expected())
+
+    def test_unordered(self):
+        results = batch.iter_errors(
+            self.validator,
+            self.instances,
+            workers=2,
+            chunksize=3,
+            ordered=False,
+        )
+        self.assertEqual(sorted(self.messages(results)), self.expected())
+
+    def test_error_details_survive(self):
+        (_, errors), = batch.iter_errors(self.validator, [[1, 7]], workers=1)
+        error, = errors
+        self.assertEqual(error.validator, u"maximum")
+        self.assertEqual(list(error.path), [1])
+        self.assertEqual(error.schema, self.schema[u"definitions"][u"small"])
+
+    def test_format_checker_is_used(self):
+        validator = Draft4Validator(
+            {u"format": u"ipv4"}, format_checker=FormatChecker(),
+        )
+        results = batch.iter_errors(validator, [u"1.1.1.1", u"12"], workers=1)
+        message = "%r is not a %r" % (u"12", u"ipv4")
+        self.assertEqual(self.messages(results), [(0, []), (1, [message])])
+
+    def test_instances_are_consumed_lazily(self):
+        def instances():
+            while True:
+                yield [1]
+
+        results = batch.iter_errors(self.validator, instances(), workers=1)
+        self.assertEqual(next(results), (0, []))
+        results.close()
+
+    def test_max_errors_is_used(self):
+        validator = Draft4Validator(
+            {u"items": {u"maximum": 3}}, max_errors=2,
+        )
+        (_, errors), = batch.iter_errors(validator, [[4, 5, 6]], workers=1)
+        self.assertEqual([list(error.path) for error in errors], [[0], [1]])
+
+    def test_load_errors_are_raised_in_place_of_their_result(self):
+        results = batch.iter_errors(
+            self.validator, [u"1", u"2", u"x", u"4"], workers=1, load=int,
+        )
+        self.assertEqual(next(results), (0, []))
+        self.assertEqual(next(results), (1, []))
+        with self.assertRaises(ValueError):
+            next(results)
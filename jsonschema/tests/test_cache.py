@@ -0,0 +1,70 @@
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+
+from jsonschema.cache import DirectoryCache
+from jsonschema.tests.compat import mock
+
+
+class TestDirectoryCache(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "cache")
+
+    def test_missing(self):
+        self.assertIsNone(DirectoryCache(self.path).get("http://foo/bar"))
+
+    def test_set_and_get(self):
+        cache = DirectoryCache(self.path)
+        cache.set("http://foo/bar", {"type": "integer"}, etag="abc")
+        cached = DirectoryCache(self.path).get("http://foo/bar")
+        self.assertEqual(cached.document, {"type": "integer"})
+        self.assertEqual(cached.etag, "abc")
+        self.assertTrue(cached.fresh)
+
+    def test_uris_are_normalized(self):
+        cache = DirectoryCache(self.path)
+        cache.set("http://foo/bar#", {})
+        self.assertEqual(cache.get("http://foo/bar").document, {})
+
+    def test_documents_are_replaced(self):
+        cache = DirectoryCache(self.path)
+        cache.set("http://foo/bar", 1)
+        cache.set("http://foo/bar", 2)
+        self.assertEqual(cache.get("http://foo/bar").document, 2)
+        self.assertEqual(len(os.listdir(self.path)), 1)
+
+    def test_ttl(self):
+        cache = DirectoryCache(self.path, ttl=60)
+        with mock.patch("time.time", return_value=1000):
+            cache.set("http://foo/bar", {})
+        with mock.patch("time.time", return_value=1059):
+            self.assertTrue(cache.get("http://foo/bar").fresh)
+        with mock.patch("time.time", return_value=1060):
+            self.assertFalse(cache.get("http://foo/bar").fresh)
+
+    def test_corrupt_files_are_ignored(self):
+        cache = DirectoryCache(self.path)
+        cache.set("http://foo/bar", {})
+        path, = os.listdir(self.path)
+        with open(os.path.join(self.path, path), "w") as file:
+            file.write("{")
+        self.assertIsNone(cache.get("http://foo/bar"))
+
+    def test_files_which_are_not_entries_are_ignored(self):
+        cache = DirectoryCache(self.path, ttl=60)
+        cache.set("http://foo/bar", {})
+        path, = os.listdir(self.path)
+        for contents in "[]", "{}", '{"document": {}, "stored": "x"}':
+            with open(os.path.join(self.path, path), "w") as file:
+                file.write(contents)
+            self.assertIsNone(cache.get("http://foo/bar"))
+
+    def test_unserializable_documents_leave_no_files_behind(self):
+        cache = DirectoryCache(self.path)
+        with self.assertRaises(TypeError):
+            cache.set("http://foo/bar", {"foo": object()})
+        self.assertEqual(os.listdir(self.path), [])
+        self.assertIsNone(cache.get("http://foo/bar"))
@@ -1,6 +1,11 @@
 from unittest import TestCase
+import json
+import os
+import shutil
+import tempfile
 
 from jsonschema import Draft4Validator, ValidationError, cli
+from jsonschema.cache import DirectoryCache
 from jsonschema.compat import StringIO
 from jsonschema.exceptions import SchemaError
 from jsonschema.tests.compat import mock
@@ -60,6 +65,68 @@ class TestParser(TestCase):
         )
         self.assertIs(arguments["validator"], Draft4Validator)
 
+    def test_jobs_must_be_positive(self):
+        for jobs in "0", "-1":
+            with mock.patch("sys.stderr", StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as e:
+                    cli.parse_args(
+                        [
+                            "--jobs", jobs,
+                            "--instance", "foo.json",
+                            "schema.json",
+                        ]
+                    )
+            self.assertEqual(e.exception.code, 2)
+            self.assertIn("is not a positive integer", stderr.getvalue())
+
+    def test_instances_are_not_loaded_up_front_with_jobs(self):
+        arguments = cli.parse_args(
+            [
+                "--validator", "Draft4Validator",
+                "--jobs", "2",
+                "--instance", "foo.json",
+                "schema.json",
+            ]
+        )
+        self.assertEqual(arguments["instances"], ["foo.json"])
+
+    def test_max_errors(self):
+        arguments = cli.parse_args(
+            [
+                "--validator", "Draft4Validator",
+                "--max-errors", "3",
+                "--instance", "foo.json",
+                "schema.json",
+            ]
+        )
+        self.assertEqual(arguments["max_errors"], 3)
+
+    def test_max_errors_must_be_positive(self):
+        for max_errors in "0", "-2":
+            with mock.patch("sys.stderr", StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as e:
+                    cli.parse_args(
+                        [
+                            "--max-errors", max_errors,
+                            "--instance", "foo.json",
+                            "schema.json",
+                        ]
+                    )
+            self.assertEqual(e.exception.code, 2)
+            self.assertIn("usage:", stderr.getvalue())
+            self.assertIn("is not a positive integer", stderr.getvalue())
+
+    def test_ndjson_paths_are_not_loaded_up_front(self):
+        arguments = cli.parse_args(
+            [
+                "--validator", "Draft4Validator",
+                "--ndjson", "foo.ndjson",
+                "--stream", "-",
+                "schema.json",
+            ]
+        )
+        self.assertEqual(arguments["streams"], ["foo.ndjson", "-"])
+
 
 class TestCLI(TestCase):
     def test_draft3_schema_draft4_validator(self):
@@ -115,6 +182,46 @@ class TestCLI(TestCase):
         self.assertEqual(stderr.getvalue(), "1 - I am an error!")
         self.assertEqual(exit_code, 1)
 
+    def test_schema_cache(self):
+        created = []
+
+        class Validator(fake_validator()):
+            def __init__(self, *args, **kwargs):
+                created.append(kwargs)
+
+        cli.run(
+            {
+                "validator": Validator,
+                "schema": {"id": "http://example.com/"},
+                "instances": [1],
+                "error_format": "{error.message}",
+                "schema_cache": "cache_dir",
+            },
+            stdout=StringIO(),
+            stderr=StringIO(),
+        )
+        (kwargs,) = created
+        resolver = kwargs["resolver"]
+        self.assertEqual(resolver.resolution_scope, "http://example.com/")
+        self.assertIsInstance(resolver.persistent_cache, DirectoryCache)
+        self.assertEqual(resolver.persistent_cache.path, "cache_dir")
+
+    def test_max_errors(self):
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {"items": {"type": "string"}},
+                "instances": [[1, 2, 3], [4, 5, 6]],
+                "error_format": "{error.instance}\t",
+                "max_errors": 2,
+            },
+            stdout=stdout,
+            stderr=stderr,
+        )
+        self.assertEqual(stderr.getvalue(), "1\t2\t4\t5\t")
+        self.assertEqual(exit_code, 1)
+
     def test_unsuccessful_validation_multiple_instances(self):
         first_errors = [
             ValidationError("9", instance=1),
@@ -135,3 +242,138 @@ class TestCLI(TestCase):
         self.assertFalse(stdout.getvalue())
         self.assertEqual(stderr.getvalue(), "1 - 9\t1 - 8\t2 - 7\t")
         self.assertEqual(exit_code, 1)
+
+    def test_ndjson_from_stdin(self):
+        stdout, stderr = StringIO(), StringIO()
+        stdin = StringIO(u'1\n"foo"\n\n2\n[]\n')
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {"type": "integer"},
+                "instances": None,
+                "streams": ["-"],
+                "error_format": "{error.message}\n",
+            },
+            stdout=stdout,
+            stderr=stderr,
+            stdin=stdin,
+        )
+        self.assertFalse(stdout.getvalue())
+        self.assertEqual(
+            stderr.getvalue(),
+            "<stdin>:2: %r is not of type 'integer'\n"
+            "<stdin>:5: [] is not of type 'integer'\n" % (u"foo",),
+        )
+        self.assertEqual(exit_code, 1)
+
+    def test_ndjson_from_file(self):
+        stdout, stderr = StringIO(), StringIO()
+        lines = StringIO(u'{}\n{"foo": 3}\n')
+        open_ = mock.MagicMock()
+        open_.return_value.__enter__.return_value = lines
+        with mock.patch.object(cli, "open", open_, create=True):
+            exit_code = cli.run(
+                {
+                    "validator": Draft4Validator,
+                    "schema": {"required": ["foo"]},
+                    "instances": None,
+                    "streams": ["foo.ndjson"],
+                    "error_format": "{error.message}\n",
+                },
+                stdout=stdout,
+                stderr=stderr,
+            )
+        open_.assert_called_once_with("foo.ndjson")
+        self.assertEqual(
+            stderr.getvalue(),
+            "foo.ndjson:1: %r is a required property\n" % (u"foo",),
+        )
+        self.assertEqual(exit_code, 1)
+
+    def test_ndjson_invalid_line(self):
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {},
+                "instances": None,
+                "streams": ["-"],
+                "error_format": "{error.message}\n",
+            },
+            stdout=stdout,
+            stderr=stderr,
+            stdin=StringIO(u"12\n{not json\n"),
+        )
+        self.assertTrue(stderr.getvalue().startswith("<stdin>:2: "))
+        self.assertEqual(exit_code, 1)
+
+    def test_successful_ndjson(self):
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {"type": "integer"},
+                "instances": None,
+                "streams": ["-"],
+                "error_format": "{error.message}\n",
+            },
+            stdout=stdout,
+            stderr=stderr,
+            stdin=StringIO(u"1\n2\n"),
+        )
+        self.assertFalse(stderr.getvalue())
+        self.assertEqual(exit_code, 0)
+
+
+class TestParallelCLI(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def instance(self, name, contents):
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as file:
+            file.write(contents)
+        return path
+
+    def run_cli(self, jobs, paths):
+        schema = self.instance("schema.json", json.dumps({"maximum": 3}))
+        args = [arg for path in paths for arg in ("--instance", path)]
+        if jobs:
+            args.extend(["--jobs", str(jobs)])
+        arguments = cli.parse_args(args + [schema])
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(arguments, stdout=stdout, stderr=stderr)
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def test_same_output_as_serial(self):
+        paths = [
+            self.instance("%s.json" % (i,), json.dumps(i)) for i in range(10)
+        ]
+        self.assertEqual(self.run_cli(3, paths), self.run_cli(0, paths))
+        self.assertEqual(
+            self.run_cli(3, paths),
+            (
+                True,
+                "",
+                "".join(
+                    "%s: %s is greater than the maximum of 3\n" % (i, i)
+                    for i in range(4, 10)
+                ),
+            ),
+        )
+
+    def test_successful(self):
+        paths = [self.instance("%s.json" % (i,), "1") for i in range(4)]
+        self.assertEqual(self.run_cli(2, paths), (False, "", ""))
+
+    def test_invalid_instance(self):
+        good, bad = self.instance("good.json", "1"), self.instance("bad", "{")
+        with mock.patch("sys.stderr", StringIO()) as stderr:
+            with self.assertRaises(SystemExit) as e:
+                self.run_cli(2, [good, good, bad, good])
+        self.assertEqual(e.exception.code, 2)
+        self.assertIn(
+            "invalid _json_file value: %r" % (bad,), stderr.getvalue(),
+        )
+        self.assertNotIn(repr(good), stderr.getvalue())
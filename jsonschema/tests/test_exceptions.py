@@ -1,4 +1,5 @@
 from unittest import TestCase
+import pickle
 import textwrap
 
 from jsonschema import Draft4Validator, exceptions
@@ -320,6 +321,67 @@ class TestErrorInitReprStr(TestCase):
             "<ValidationError: %r>" % "Hello!",
         )
 
+    def test_message_args_are_interpolated(self):
+        error = self.make_error(message="%r is %s", message_args=(12, "bad"))
+        self.assertEqual(error.message, "12 is bad")
+        self.assertEqual(str(error).partition("\n")[0], "12 is bad")
+
+    def test_message_args_are_only_interpolated_when_needed(self):
+        reprs = []
+
+        class Instance(object):
+            def __repr__(self):
+                reprs.append(self)
+                return "<Instance>"
+
+        error = self.make_error(message="%r", message_args=(Instance(),))
+        self.assertEqual(reprs, [])
+        self.assertEqual(error.message, "<Instance>")
+
+    def test_setting_the_message_replaces_message_args(self):
+        error = self.make_error(message="%r", message_args=(12,))
+        error.message = "%r is literal"
+        self.assertEqual(error.message, "%r is literal")
+
+    def test_pickling(self):
+        error = self.make_error(
+            message="%r is bad",
+            message_args=(12,),
+            path=[0],
+            cause=ValueError(),
+        )
+        unpickled = pickle.loads(pickle.dumps(error))
+        self.assertEqual(str(unpickled), str(error))
+        self.assertEqual(unpickled.path, error.path)
+        self.assertIs(unpickled.relative_path, unpickled.path)
+        self.assertIsInstance(unpickled.cause, ValueError)
+
+    def test_pickling_keeps_unset_attributes_unset(self):
+        error = exceptions.ValidationError("message")
+        unpickled = pickle.loads(pickle.dumps(error))
+        self.assertEqual(str(unpickled), "message")
+        unpickled._set(validator="foo")
+        self.assertEqual(unpickled.validator, "foo")
+
+    def test_pickling_errors_with_context(self):
+        validator = Draft4Validator(
+            {
+                "properties": {
+                    "foo": {"anyOf": [{"type": "string"}, {"minimum": 3}]},
+                },
+            },
+        )
+        error, = validator.iter_errors({"foo": 1})
+        unpickled = pickle.loads(pickle.dumps(error))
+        child = unpickled.context[0]
+        self.assertIs(child.parent, unpickled)
+        self.assertEqual(list(child.absolute_path), ["foo"])
+
+    def test_create_from_keeps_message_args(self):
+        error = self.make_error(message="%s %s", message_args=("foo", 12))
+        schema_error = exceptions.SchemaError.create_from(error)
+        self.assertEqual(schema_error.message, "foo 12")
+
     def test_unset_error(self):
         error = exceptions.ValidationError("message")
         self.assertEqual(str(error), "message")
@@ -46,6 +46,7 @@ class TestFormatChecker(TestCase):
 
         self.assertIs(cm.exception.cause, cause)
         self.assertIs(cm.exception.__cause__, cause)
+        self.assertEqual(str(cm.exception), "%r is not a %r" % ("bar", "foo"))
 
         # Unregistered errors should not be caught
         self.fn.side_effect = AttributeError
@@ -62,3 +63,20 @@ class TestFormatChecker(TestCase):
             validator.validate("bar")
 
         self.assertIs(cm.exception.__cause__, cause)
+
+    def test_format_error_messages_are_only_formatted_when_needed(self):
+        reprs = []
+
+        class Instance(object):
+            def __repr__(self):
+                reprs.append("<Instance>")
+                return "<Instance>"
+
+        checker = FormatChecker(formats=())
+        checker.checks("foo")(self.fn)
+        self.fn.return_value = False
+        validator = Draft4Validator({"format": "foo"}, format_checker=checker)
+
+        error, = validator.iter_errors(Instance())
+        self.assertEqual(reprs, [])
+        self.assertEqual(error.message, "<Instance> is not a %r" % ("foo",))
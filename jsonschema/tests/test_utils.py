@@ -0,0 +1,184 @@
+from unittest import TestCase
+import re
+
+from jsonschema import _utils
+from jsonschema.tests.compat import mock
+
+
+class TestURIDict(TestCase):
+    def test_lookups_are_normalized(self):
+        uris = _utils.URIDict()
+        uris["http://example.com/foo#"] = 1
+        self.assertEqual(uris["http://example.com/foo"], 1)
+        self.assertEqual(uris["http://example.com/foo#"], 1)
+        self.assertEqual(list(uris), ["http://example.com/foo"])
+
+    def test_normalized_uris_are_not_normalized_again(self):
+        uris = _utils.URIDict()
+        uris["http://example.com/foo"] = 1
+        with mock.patch.object(uris, "normalize") as normalize:
+            self.assertEqual(uris["http://example.com/foo"], 1)
+        self.assertFalse(normalize.called)
+
+    def test_update_from_a_uri_dict_is_trusted(self):
+        other = _utils.URIDict({"http://example.com/foo": 1})
+        uris = _utils.URIDict()
+        with mock.patch.object(uris, "normalize") as normalize:
+            uris.update(other)
+        self.assertFalse(normalize.called)
+        self.assertEqual(uris["http://example.com/foo#"], 1)
+
+    def test_update(self):
+        uris = _utils.URIDict()
+        uris.update({"http://example.com/foo#": 1}, bar=2)
+        self.assertEqual(
+            dict(uris.store), {"http://example.com/foo": 1, "bar": 2},
+        )
+
+
+class TestLayeredURIDict(TestCase):
+    def test_lookups(self):
+        uris = _utils.LayeredURIDict(base={"http://example.com/base": 1})
+        uris["http://example.com/foo#"] = 2
+        self.assertEqual(uris["http://example.com/base#"], 1)
+        self.assertEqual(uris["http://example.com/base"], 1)
+        self.assertEqual(uris["http://example.com/foo"], 2)
+        with self.assertRaises(KeyError):
+            uris["http://example.com/bar"]
+
+    def test_own_items_shadow_the_base(self):
+        uris = _utils.LayeredURIDict(base={"http://example.com/base": 1})
+        uris["http://example.com/base#"] = 2
+        self.assertEqual(uris["http://example.com/base"], 2)
+        self.assertEqual(len(uris), 1)
+
+
+class TestParsePointer(TestCase):
+    def test_tokens(self):
+        self.assertEqual(
+            _utils.parse_pointer(u"/definitions/a~1b~0c/%25/0/x1"),
+            (
+                (u"definitions", None),
+                (u"a/b~c", None),
+                (u"%", None),
+                (u"0", 0),
+                (u"x1", None),
+            ),
+        )
+
+    def test_empty(self):
+        self.assertEqual(_utils.parse_pointer(u""), ())
+        self.assertEqual(_utils.parse_pointer(u"/"), ())
+
+
+class TestCanonical(TestCase):
+    def assertSame(self, one, two):
+        self.assertEqual(_utils.canonical(one), _utils.canonical(two))
+        self.assertEqual(
+            hash(_utils.canonical(one)), hash(_utils.canonical(two)),
+        )
+
+    def assertDifferent(self, one, two):
+        self.assertNotEqual(_utils.canonical(one), _utils.canonical(two))
+
+    def test_numbers(self):
+        self.assertSame(1, 1.0)
+        self.assertDifferent(1, 2)
+
+    def test_bools_are_not_numbers(self):
+        self.assertDifferent(True, 1)
+        self.assertDifferent(False, 0)
+        self.assertDifferent([True], [1])
+        self.assertDifferent({"a": False}, {"a": 0})
+
+    def test_containers(self):
+        self.assertSame({"a": [1, {"b": None}]}, {"a": [1.0, {"b": None}]})
+        self.assertDifferent({"a": [1, 2]}, {"a": [2, 1]})
+        self.assertDifferent([], {})
+        self.assertDifferent([u"a", u"b"], {u"a": u"b"})
+
+
+class TestFindDuplicate(TestCase):
+    def test_unique(self):
+        self.assertIsNone(_utils.find_duplicate([1, True, [1], [True], {}]))
+
+    def test_first_duplicate_pair(self):
+        instance = [{u"a": 1}, [1, 2], 3, [1, 2.0], {u"a": 1}]
+        self.assertEqual(_utils.find_duplicate(instance), (1, 3))
+
+    def test_unhashable_elements(self):
+        self.assertEqual(
+            _utils.find_duplicate([set([1]), 0, False, set([1])]), (0, 3),
+        )
+        self.assertIsNone(_utils.find_duplicate([set([1]), 1, True]))
+
+    def test_scalars(self):
+        self.assertIsNone(_utils.find_duplicate([1, True, 0, False, u"1"]))
+        self.assertEqual(_utils.find_duplicate([1, 2, True, 1.0]), (0, 3))
+
+    def test_unique_scalars_are_not_canonicalized(self):
+        with mock.patch.object(_utils, "canonical") as canonical:
+            self.assertIsNone(_utils.find_duplicate(list(range(100))))
+        self.assertFalse(canonical.called)
+
+    def test_many_records(self):
+        records = [{u"id": i, u"tags": [u"x", i]} for i in range(50000)]
+        self.assertIsNone(_utils.find_duplicate(records))
+        records.append({u"tags": [u"x", 10], u"id": 10})
+        self.assertEqual(_utils.find_duplicate(records), (10, 50000))
+
+
+class TestKnownProperties(TestCase):
+    def test_properties(self):
+        known = _utils.KnownProperties({u"a": {}, u"b": {}})
+        self.assertTrue(known(u"a"))
+        self.assertFalse(known(u"c"))
+        instance = {u"a": 1, u"c": 2, u"d": 3}
+        self.assertEqual(sorted(known.extras(instance)), [u"c", u"d"])
+        self.assertTrue(known.has_extras(instance))
+        self.assertFalse(known.has_extras({u"b": 1}))
+
+    def test_patterns(self):
+        known = _utils.KnownProperties({u"a": {}}, re.compile(u"^x").search)
+        self.assertTrue(known(u"xyz"))
+        self.assertFalse(known(u"yz"))
+        instance = {u"a": 1, u"x": 2, u"y": 3}
+        self.assertEqual(list(known.extras(instance)), [u"y"])
+        self.assertTrue(known.has_extras(instance))
+        self.assertFalse(known.has_extras({u"x1": 1, u"x2": 2}))
+
+    def test_more_properties_than_are_known_are_not_looked_at(self):
+        class Unlookable(dict):
+            def __iter__(self):
+                raise AssertionError("Should not have been iterated over!")
+
+        known = _utils.KnownProperties({u"a": {}})
+        self.assertTrue(known.has_extras(Unlookable(a=1, b=2)))
+
+    def test_stops_at_the_first_extra(self):
+        search = mock.Mock(return_value=None)
+        known = _utils.KnownProperties({}, search)
+        self.assertTrue(known.has_extras({u"a": 1, u"b": 2, u"c": 3}))
+        self.assertEqual(search.call_count, 1)
+
+
+class TestLRUCache(TestCase):
+    def test_least_recently_used_are_evicted(self):
+        cache = _utils.LRUCache(maxsize=2)
+        cache["a"], cache["b"] = 1, 2
+        cache.get("a")
+        cache["c"] = 3
+        self.assertEqual([cache.get(key) for key in "abc"], [1, None, 3])
+
+    def test_unbounded(self):
+        cache = _utils.LRUCache(maxsize=None)
+        for i in range(100):
+            cache[i] = i
+        self.assertEqual(len(cache), 100)
+
+    def test_pop(self):
+        cache = _utils.LRUCache(maxsize=2)
+        cache["a"] = 1
+        self.assertEqual(cache.pop("a"), 1)
+        self.assertIsNone(cache.pop("a"))
+        self.assertEqual(len(cache), 0)
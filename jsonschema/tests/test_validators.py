@@ -1,10 +1,21 @@
-from collections import deque
+from collections import OrderedDict, deque
 from contextlib import contextmanager
+from decimal import Decimal
+from types import GeneratorType
 from unittest import TestCase
 import json
+import re
+import socket
+import threading
 
-from jsonschema import FormatChecker, SchemaError, ValidationError
-from jsonschema.tests.compat import mock
+from jsonschema import (
+    FormatChecker, SchemaError, ValidationError, _utils, validators,
+)
+from jsonschema.cache import CachedDocument
+from jsonschema.compat import HTTPError, URLError
+from jsonschema.tests.compat import (
+    BaseHTTPRequestHandler, HTTPServer, mock,
+)
 from jsonschema.validators import (
     RefResolutionError, UnknownType, Draft3Validator,
     Draft4Validator, RefResolver, create, extend, validator_for, validate,
@@ -108,6 +119,499 @@ class TestIterErrors(TestCase):
         errors = list(self.validator.iter_errors(instance, schema))
         self.assertEqual(len(errors), 4)
 
+    def test_iter_errors_does_not_repr_the_instance(self):
+        class Unrepresentable(list):
+            def __repr__(self):
+                raise AssertionError("Should not have been repr'ed!")
+
+        instance = Unrepresentable([1, 1, 1])
+        schema = {
+            u"enum": [[2]],
+            u"maxItems": 2,
+            u"uniqueItems": True,
+            u"type": u"object",
+        }
+        errors = list(self.validator.iter_errors(instance, schema))
+        self.assertEqual(len(errors), 4)
+
+
+class TestMaxErrors(TestCase):
+    def test_max_errors(self):
+        schema = {u"items": {u"type": u"string"}}
+        validator = Draft4Validator(schema, max_errors=3)
+        for each in validator, validator.compile():
+            errors = list(each.iter_errors(list(range(10))))
+            self.assertEqual([list(error.path) for error in errors], [
+                [0], [1], [2],
+            ])
+
+    def test_fail_fast(self):
+        validator = Draft4Validator(
+            {u"minimum": 3, u"type": u"string"}, fail_fast=True,
+        )
+        self.assertEqual(validator.max_errors, 1)
+        self.assertEqual(len(list(validator.iter_errors(1))), 1)
+
+    def test_only_as_many_errors_as_needed_are_found(self):
+        def instance():
+            for i in range(3):
+                yield i
+            raise AssertionError("Should not have looked for more errors!")
+
+        schema = {u"items": {u"type": u"string"}}
+        validator = Draft4Validator(
+            schema, types={u"array": GeneratorType}, max_errors=3,
+        )
+        self.assertEqual(len(list(validator.iter_errors(instance()))), 3)
+
+    def test_combinator_contexts_are_limited(self):
+        schema = {
+            u"anyOf": [
+                {u"items": {u"type": u"string"}},
+                {u"items": {u"type": u"object"}},
+            ],
+        }
+        instance = list(range(10))
+        for validator in (
+            Draft4Validator(schema, max_errors=3),
+            Draft4Validator(
+                {u"oneOf": schema[u"anyOf"]}, max_errors=3,
+            ).compile(),
+            Draft3Validator({u"type": schema[u"anyOf"]}, max_errors=3),
+        ):
+            error, = validator.iter_errors(instance)
+            self.assertEqual(
+                [list(each.schema_path) for each in error.context], [
+                    [0, u"items", u"type"],
+                    [0, u"items", u"type"],
+                    [0, u"items", u"type"],
+                ],
+            )
+
+    def test_additional_properties_are_limited(self):
+        validator = Draft4Validator(
+            {u"additionalProperties": False}, fail_fast=True,
+        )
+        error, = validator.iter_errors(dict.fromkeys(u"abc"))
+        self.assertTrue(re.search(r"'.' was unexpected\)$", error.message))
+
+    def test_unlimited(self):
+        validator = Draft4Validator({u"items": {u"type": u"string"}})
+        self.assertIsNone(validator.max_errors)
+        self.assertEqual(len(list(validator.iter_errors([1] * 100))), 100)
+
+    def test_max_errors_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            Draft4Validator({}, max_errors=0)
+
+
+class TestCompile(TestCase):
+    schema = {
+        u"id": u"http://example.com/root.json",
+        u"definitions": {
+            u"positive": {u"type": u"integer", u"minimum": 1},
+        },
+        u"properties": {
+            u"foo": {u"$ref": u"#/definitions/positive"},
+            u"bar": {u"items": {u"$ref": u"#/definitions/positive"}},
+        },
+        u"additionalProperties": False,
+    }
+
+    def test_it_returns_a_copy(self):
+        validator = Draft4Validator(self.schema)
+        compiled = validator.compile()
+        self.assertIsNot(compiled, validator)
+        self.assertIs(compiled.schema, validator.schema)
+        self.assertIs(compiled.resolver, validator.resolver)
+
+    def test_compiled_errors_are_the_same(self):
+        instance = {u"foo": 0, u"bar": [1, u"2", -3], u"baz": 12}
+        validator = Draft4Validator(self.schema)
+        compiled = validator.compile()
+
+        def details(errors):
+            return sorted(
+                (
+                    error.message,
+                    list(error.path),
+                    list(error.schema_path),
+                    error.validator,
+                    error.validator_value,
+                    error.instance,
+                )
+                for error in errors
+            )
+
+        expected = details(validator.iter_errors(instance))
+        self.assertEqual(len(expected), 4)
+        for _ in range(2):
+            got = details(compiled.iter_errors(instance))
+            self.assertEqual(got, expected)
+
+    def test_uncompiled_validators_do_not_compile(self):
+        validator = Draft4Validator(self.schema)
+        instance = {u"foo": 0, u"bar": [1, u"2"]}
+        with mock.patch("jsonschema.validators._compile") as _compile:
+            self.assertFalse(validator.is_valid(instance))
+            self.assertEqual(len(list(validator.iter_errors(instance))), 2)
+        self.assertFalse(_compile.called)
+
+    def test_each_schema_is_compiled_once(self):
+        compiled = Draft4Validator(self.schema).compile()
+        instance = {u"foo": 2, u"bar": [1, 2, 3]}
+
+        with mock.patch(
+            "jsonschema.validators._compile",
+            wraps=validators._compile,
+        ) as _compile:
+            compiled.validate(instance)
+            compiled.validate(instance)
+
+        compiled_ids = [id(schema) for _, schema in _compile.call_args_list]
+        self.assertEqual(len(compiled_ids), len(set(compiled_ids)))
+
+    def test_known_properties_are_precomputed(self):
+        compiled = Draft4Validator(self.schema).compile()
+        with mock.patch(
+            "jsonschema._utils.known_properties",
+            wraps=_utils.known_properties,
+        ) as known_properties:
+            for _ in range(3):
+                compiled.is_valid({u"foo": 2})
+                list(compiled.iter_errors({u"foo": 2, u"baz": 3}))
+        self.assertEqual(known_properties.call_count, 1)
+
+    def test_refs_are_resolved_once(self):
+        compiled = Draft4Validator(self.schema).compile()
+        instance = {u"foo": 2, u"bar": [1, 2, 3]}
+        with mock.patch.object(
+            compiled.resolver, "resolve", wraps=compiled.resolver.resolve,
+        ) as resolve:
+            for _ in range(3):
+                compiled.validate(instance)
+                compiled.is_valid(instance)
+                list(compiled.iter_errors({u"foo": 0, u"bar": [0]}))
+        self.assertEqual(resolve.call_count, 2)
+        self.assertEqual(
+            compiled.resolver.resolution_scope, self.schema[u"id"],
+        )
+
+    def test_refs_are_resolved_in_the_scope_they_are_followed_from(self):
+        schema = {
+            u"id": u"http://example.com/root.json",
+            u"properties": {
+                u"foo": {u"$ref": u"#/definitions/positive"},
+                u"bar": {
+                    u"id": u"other.json",
+                    u"properties": {u"foo": {u"$ref": u"#/definitions/s"}},
+                },
+            },
+            u"definitions": {u"positive": {u"minimum": 1}},
+        }
+        other = {u"definitions": {u"s": {u"type": u"string"}}}
+        resolver = RefResolver.from_schema(
+            schema, store={u"http://example.com/other.json": other},
+        )
+        compiled = Draft4Validator(schema, resolver=resolver).compile()
+        for _ in range(2):
+            self.assertTrue(compiled.is_valid({u"bar": {u"foo": u"a"}}))
+            self.assertFalse(compiled.is_valid({u"bar": {u"foo": 2}}))
+            error, = compiled.iter_errors({u"foo": 0})
+            self.assertEqual(error.validator, u"minimum")
+            self.assertEqual(
+                list(error.schema_path), [u"properties", u"foo", u"minimum"],
+            )
+
+    def test_keywords_for_other_types_are_skipped(self):
+        objects_only = mock.Mock(return_value=())
+        Validator = extend(Draft4Validator, {u"objectsOnly": objects_only})
+        schema = {u"objectsOnly": True, u"minLength": 2}
+        with mock.patch.dict(
+            validators._INSTANCE_TYPES, {objects_only: u"object"},
+        ):
+            validator = Validator(schema).compile()
+            self.assertFalse(validator.is_valid(u"a"))
+            self.assertEqual(len(list(validator.iter_errors(u"a"))), 1)
+            self.assertFalse(objects_only.called)
+
+            self.assertEqual(list(validator.iter_errors({})), [])
+            self.assertTrue(objects_only.called)
+
+    def test_keywords_are_not_grouped_by_type_when_uncompiled(self):
+        validator = Draft4Validator({u"minLength": 2, u"minItems": 1})
+        with mock.patch("jsonschema.validators._applicable") as _applicable:
+            self.assertFalse(validator.is_valid(u"a"))
+            self.assertEqual(len(list(validator.iter_errors([]))), 1)
+        self.assertFalse(_applicable.called)
+
+    def test_keywords_are_not_skipped_for_other_python_types(self):
+        compiled = Draft4Validator({u"minProperties": 1}).compile()
+        self.assertFalse(compiled.is_valid(OrderedDict()))
+
+        compiled = Draft4Validator(
+            {u"required": [u"a"]}, types={u"object": (dict, list)},
+        ).compile()
+        self.assertFalse(compiled.is_valid([]))
+        self.assertTrue(compiled.is_valid(u"a"))
+
+    def test_enums_are_indexed(self):
+        compiled = Draft4Validator({u"enum": [[1], {u"a": 2}, 3]}).compile()
+        with mock.patch(
+            "jsonschema._utils.enum_members", wraps=_utils.enum_members,
+        ) as enum_members:
+            for _ in range(3):
+                self.assertTrue(compiled.is_valid({u"a": 2.0}))
+                self.assertFalse(compiled.is_valid([2]))
+                self.assertEqual(list(compiled.iter_errors(3)), [])
+        self.assertEqual(enum_members.call_count, 1)
+
+    def test_disallow_does_not_compile_throwaway_schemas(self):
+        compiled = Draft3Validator({u"disallow": [u"string"]}).compile()
+        for _ in range(3):
+            compiled.validate(12)
+        self.assertEqual(len(compiled._compiled), 1)
+
+
+class TestObjectProperties(TestCase):
+    schemas = [
+        {
+            u"properties": {u"a": {u"type": u"integer"}},
+            u"patternProperties": {u"^a": {u"minimum": 2}, u"b$": {}},
+            u"additionalProperties": False,
+        },
+        {
+            u"properties": {u"a": {u"type": u"integer"}, u"b": {}},
+            u"additionalProperties": {u"type": u"string"},
+        },
+        {
+            u"patternProperties": {u"^x": {u"type": u"string"}},
+            u"additionalProperties": False,
+        },
+        {u"patternProperties": {u"^x": {u"type": u"string"}, u"y": {}}},
+        {u"properties": {u"a": {}}, u"additionalProperties": True},
+        {u"patternProperties": {}, u"additionalProperties": False},
+    ]
+    instances = [
+        {},
+        {u"a": 1},
+        {u"a": 2, u"ab": 3},
+        {u"a": u"2"},
+        {u"b": 1, u"ab": 1},
+        {u"x": u"x", u"xy": 2},
+        {u"x": u"x", u"c": u"c"},
+        {u"c": 12},
+        {u"a": 2, u"b": 3, u"c": u"d"},
+        [u"a"],
+    ]
+
+    def test_validity_agrees_with_errors(self):
+        for cls in Draft3Validator, Draft4Validator:
+            for schema in self.schemas:
+                for instance in self.instances:
+                    validator = cls(schema)
+                    errors = list(validator.iter_errors(instance))
+                    for each in validator, validator.compile():
+                        self.assertEqual(
+                            each.is_valid(instance), not errors,
+                            msg=(cls, schema, instance),
+                        )
+
+    def test_properties_are_each_checked_once(self):
+        schema = self.schemas[0]
+        compiled = Draft4Validator(schema).compile()
+        compiled.is_valid({u"a": 2, u"ab": 3, u"b": 4})
+        with mock.patch.object(compiled, "is_valid") as is_valid:
+            is_valid.return_value = True
+            self.assertTrue(
+                validators._predicates.object_properties(
+                    compiled,
+                    frozenset(schema),
+                    {u"a": 2, u"ab": 3, u"ac": 4},
+                    schema,
+                ),
+            )
+        self.assertEqual(
+            sorted(
+                (args for args, _ in is_valid.call_args_list), key=json.dumps,
+            ),
+            sorted([
+                (2, schema[u"properties"][u"a"]),
+                (2, schema[u"patternProperties"][u"^a"]),
+                (3, schema[u"patternProperties"][u"^a"]),
+                (3, schema[u"patternProperties"][u"b$"]),
+                (4, schema[u"patternProperties"][u"^a"]),
+            ], key=json.dumps),
+        )
+
+    def test_only_compiled_validators_check_properties_at_once(self):
+        schema = self.schemas[0]
+        instance = {u"a": 2, u"ab": 3, u"c": 4}
+        with mock.patch(
+            "jsonschema._predicates.object_properties",
+            wraps=validators._predicates.object_properties,
+        ) as object_properties:
+            self.assertFalse(Draft4Validator(schema).is_valid(instance))
+            self.assertFalse(object_properties.called)
+            compiled = Draft4Validator(schema).compile()
+            self.assertFalse(compiled.is_valid(instance))
+            self.assertTrue(object_properties.called)
+
+    def test_each_pattern_is_matched_separately(self):
+        # Neither of these behave the same when joined into one regex.
+        backreferences = {
+            u"patternProperties": {
+                u"(a)\\1": {u"type": u"string"},
+                u"(b)\\1": {u"type": u"string"},
+            },
+            u"properties": {u"c": {}},
+        }
+        flags = {
+            u"patternProperties": {
+                u"^x": {},
+                u"(?i)^y": {u"type": u"string"},
+            },
+            u"properties": {u"c": {}},
+        }
+        for schema, instance in [
+            (backreferences, {u"bb": 1}),
+            (flags, {u"Y": 1}),
+        ]:
+            validator = Draft4Validator(schema)
+            errors = list(validator.iter_errors(instance))
+            self.assertEqual(
+                [error.message for error in errors],
+                ["1 is not of type %r" % (u"string",)],
+            )
+            self.assertFalse(validator.is_valid(instance))
+            self.assertFalse(validator.compile().is_valid(instance))
+
+
+class TestThreads(TestCase):
+    schema = {
+        u"id": u"http://example.com/root.json",
+        u"type": u"object",
+        u"properties": {
+            u"tree": {u"$ref": u"#/definitions/tree"},
+            u"other": {
+                u"id": u"other.json",
+                u"items": {u"$ref": u"#/definitions/short"},
+            },
+        },
+        u"definitions": {
+            u"tree": {
+                u"properties": {
+                    u"value": {u"type": u"integer"},
+                    u"children": {
+                        u"items": {u"$ref": u"#/definitions/tree"},
+                    },
+                },
+            },
+        },
+    }
+    store = {
+        u"http://example.com/other.json": {
+            u"definitions": {u"short": {u"maxLength": 2}},
+        },
+    }
+
+    def instance(self, n):
+        return {
+            u"tree": {
+                u"value": n,
+                u"children": [
+                    {u"value": u"x" * n},
+                    {u"children": [{u"value": n}, {u"value": [n]}]},
+                ],
+            },
+            u"other": [u"a" * n, u"b"],
+        }
+
+    def details(self, validator, instance):
+        return sorted(
+            (list(error.path), list(error.schema_path), error.message)
+            for error in validator.iter_errors(instance)
+        )
+
+    def test_one_validator_in_many_threads(self):
+        resolver = RefResolver.from_schema(self.schema, store=self.store)
+        validator = Draft4Validator(self.schema, resolver=resolver).compile()
+        instances = [self.instance(n) for n in range(6)]
+        expected = [
+            self.details(
+                Draft4Validator(
+                    self.schema,
+                    resolver=RefResolver.from_schema(
+                        self.schema, store=self.store,
+                    ),
+                ),
+                instance,
+            )
+            for instance in instances
+        ]
+        self.assertTrue(all(expected[3]))
+
+        results = []
+
+        def validate():
+            for _ in range(30):
+                for instance, details in zip(instances, expected):
+                    got = self.details(validator, instance)
+                    valid = validator.is_valid(instance)
+                    results.append(got == details and valid == (not got))
+            results.append(resolver.resolution_scope == self.schema[u"id"])
+
+        threads = [threading.Thread(target=validate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 8 * (30 * 6 + 1))
+        self.assertTrue(all(results))
+
+    def test_scopes_are_per_thread(self):
+        resolver = RefResolver(u"http://example.com/", {})
+        resolver.push_scope(u"foo/")
+        scopes = []
+        thread = threading.Thread(
+            target=lambda: scopes.append(resolver.resolution_scope),
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(scopes, [u"http://example.com/"])
+        self.assertEqual(resolver.resolution_scope, u"http://example.com/foo/")
+
+
+class TestRegexes(TestCase):
+    def test_patterns_are_compiled_once_per_validator(self):
+        schema = {
+            u"patternProperties": {u"^x-": {u"pattern": u"^a"}},
+            u"additionalProperties": False,
+        }
+        validator = Draft4Validator(schema)
+
+        with mock.patch(
+            "jsonschema.validators.re.compile", wraps=re.compile,
+        ) as compile:
+            for _ in range(3):
+                validator.is_valid({u"x-foo": u"abc", u"x-bar": u"a"})
+                list(validator.iter_errors({u"x-foo": u"bc", u"y": 1}))
+
+        patterns = sorted(args[0] for args, _ in compile.call_args_list)
+        self.assertEqual(patterns, [u"^a", u"^x-"])
+
+    def test_patternProperties_are_combined_for_additionalProperties(self):
+        schema = {
+            u"patternProperties": {u"^x-": {}, u"^y-": {}},
+            u"additionalProperties": False,
+        }
+        validator = Draft4Validator(schema)
+        self.assertTrue(validator.is_valid({u"x-1": 1, u"y-2": 2}))
+        self.assertFalse(validator.is_valid({u"x-1": 1, u"z-3": 3}))
+        self.assertIn(
+            "|".join(schema[u"patternProperties"]), validator._regexes,
+        )
+
 
 class TestValidationErrorMessages(TestCase):
     def message_for(self, instance, schema, *args, **kwargs):
@@ -180,6 +684,16 @@ class TestValidationErrorMessages(TestCase):
         self.assertIn(repr("bar"), message)
         self.assertIn("were unexpected)", message)
 
+    def test_uniqueItems_failure(self):
+        instance = [{u"a": [1]}, True, {u"a": [True]}, 1, {u"a": [1.0]}]
+        message = self.message_for(instance, {u"uniqueItems": True})
+        self.assertEqual(
+            message,
+            "%r has non-unique elements (items 0 and 4 are equal)" % (
+                instance,
+            ),
+        )
+
     def test_invalid_format_default_message(self):
         checker = FormatChecker(formats=())
         check_fn = mock.Mock(return_value=False)
@@ -622,24 +1136,27 @@ class ValidatorTestMixin(object):
         self.validator = self.validator_class(self.schema)
 
     def test_valid_instances_are_valid(self):
-        errors = iter([])
-
-        with mock.patch.object(
-            self.validator, "iter_errors", return_value=errors,
-        ):
-            self.assertTrue(
-                self.validator.is_valid(self.instance, self.schema)
-            )
+        schema = {u"items": {u"minimum": 2}}
+        self.assertTrue(self.validator.is_valid([2, 3], schema))
 
     def test_invalid_instances_are_not_valid(self):
-        errors = iter([mock.Mock()])
+        schema = {u"items": {u"minimum": 2}}
+        self.assertFalse(self.validator.is_valid([2, 1], schema))
 
-        with mock.patch.object(
-            self.validator, "iter_errors", return_value=errors,
-        ):
-            self.assertFalse(
-                self.validator.is_valid(self.instance, self.schema)
-            )
+    def test_is_valid_does_not_create_errors(self):
+        schema = {u"items": {u"minimum": 2}, u"maxItems": 1}
+        with mock.patch("jsonschema._validators.ValidationError") as error:
+            self.assertFalse(self.validator.is_valid([0, 1], schema))
+        self.assertFalse(error.called)
+
+    def test_is_valid_for_unknown_validators_uses_their_errors(self):
+        error = mock.Mock()
+        Validator = extend(
+            self.validator_class,
+            validators={u"weird": lambda *args: iter([error])},
+        )
+        self.assertFalse(Validator({u"weird": 12}).is_valid(12))
+        self.assertTrue(Validator({}).is_valid(12))
 
     def test_non_existent_properties_are_ignored(self):
         instance, my_property, my_value = mock.Mock(), mock.Mock(), mock.Mock()
@@ -678,6 +1195,49 @@ class ValidatorTestMixin(object):
         with self.assertRaises(ValidationError):
             self.validator_class(schema, resolver=resolver).validate(None)
 
+    def test_enum_does_not_confuse_bools_and_numbers(self):
+        schema = {u"enum": [1, [0], {u"a": False}, u"foo"]}
+        for validator in (
+            self.validator_class(schema),
+            self.validator_class(schema).compile(),
+        ):
+            self.assertFalse(validator.is_valid(True))
+            self.assertFalse(validator.is_valid([False]))
+            self.assertFalse(validator.is_valid({u"a": 0}))
+            self.assertEqual(len(list(validator.iter_errors(True))), 1)
+
+            self.assertTrue(validator.is_valid(1.0))
+            self.assertTrue(validator.is_valid([0]))
+            self.assertTrue(validator.is_valid({u"a": False}))
+            self.assertTrue(validator.is_valid(u"foo"))
+
+    def test_enum_does_not_confuse_numbers_and_bools(self):
+        schema = {u"enum": [True, u"foo", 2]}
+        for validator in (
+            self.validator_class(schema),
+            self.validator_class(schema).compile(),
+        ):
+            self.assertFalse(validator.is_valid(1))
+            self.assertFalse(validator.is_valid(1.0))
+            self.assertTrue(validator.is_valid(True))
+
+    def test_enum_only_canonicalizes_what_python_may_confuse(self):
+        validator = self.validator_class({u"enum": [1, 2, u"foo", None]})
+        with mock.patch.object(_utils, "canonical") as canonical:
+            self.assertTrue(validator.is_valid(2))
+            self.assertTrue(validator.is_valid(u"foo"))
+            self.assertFalse(validator.is_valid(3))
+        self.assertFalse(canonical.called)
+
+    def test_enum_with_unhashable_members(self):
+        schema = {u"enum": [set([1])]}
+        for validator in (
+            self.validator_class(schema),
+            self.validator_class(schema).compile(),
+        ):
+            self.assertTrue(validator.is_valid(set([1])))
+            self.assertFalse(validator.is_valid(set([2])))
+
     def test_is_type_is_true_for_valid_type(self):
         self.assertTrue(self.validator.is_type("foo", "string"))
 
@@ -692,6 +1252,40 @@ class ValidatorTestMixin(object):
         with self.assertRaises(UnknownType):
             self.validator.is_type("foo", object())
 
+    def test_is_type_checks_non_builtin_instances(self):
+        self.assertTrue(self.validator.is_type(Decimal(1), "number"))
+        self.assertFalse(self.validator.is_type(Decimal(1), "integer"))
+        self.assertTrue(self.validator.is_type(OrderedDict(), "object"))
+
+    def test_is_type_with_custom_types(self):
+        validator = self.validator_class(
+            {}, types={"number": float, "bool": (bool, int)},
+        )
+        self.assertFalse(validator.is_type(1, "number"))
+        self.assertTrue(validator.is_type(1.0, "number"))
+        self.assertTrue(validator.is_type(True, "bool"))
+        self.assertTrue(validator.is_type(1, "bool"))
+
+    def test_is_type_with_types_checking_instances_themselves(self):
+        class Even(type):
+            def __instancecheck__(cls, instance):
+                return isinstance(instance, int) and not instance % 2
+        even = Even("even", (object,), {})
+
+        validator = self.validator_class({}, types={"even": even})
+        self.assertTrue(validator.is_type(2, "even"))
+        self.assertFalse(validator.is_type(3, "even"))
+
+    def test_is_type_respects_changed_default_types(self):
+        default_types = self.validator_class.DEFAULT_TYPES
+        original = default_types["string"]
+        default_types["string"] = int
+        try:
+            self.assertTrue(self.validator_class({}).is_type(1, "string"))
+        finally:
+            default_types["string"] = original
+        self.assertFalse(self.validator_class({}).is_type(1, "string"))
+
 
 class TestDraft3Validator(ValidatorTestMixin, TestCase):
     validator_class = Draft3Validator
@@ -712,6 +1306,17 @@ class TestDraft3Validator(ValidatorTestMixin, TestCase):
 class TestDraft4Validator(ValidatorTestMixin, TestCase):
     validator_class = Draft4Validator
 
+    def test_valid_combinators_do_not_create_errors(self):
+        schema = {
+            u"anyOf": [{u"type": u"string"}, {u"minimum": 0}],
+            u"oneOf": [{u"type": u"string"}, {u"minimum": 0}],
+            u"not": {u"type": u"string"},
+        }
+        with mock.patch("jsonschema._validators.ValidationError") as error:
+            errors = list(self.validator_class(schema).iter_errors(1))
+        self.assertEqual(errors, [])
+        self.assertFalse(error.called)
+
 
 class TestBuiltinFormats(TestCase):
     """
@@ -760,7 +1365,63 @@ class TestValidatorFor(TestCase):
         self.assertIs(validator_for({}, default=None), None)
 
 
+class TestCheckSchema(TestCase):
+    def test_meta_schema_validator_is_shared(self):
+        Draft4Validator.check_schema({})
+        meta_validator = Draft4Validator._meta_validator
+        with mock.patch.object(Draft4Validator, "__init__") as init:
+            Draft4Validator.check_schema({"type": "string"})
+            with self.assertRaises(SchemaError):
+                Draft4Validator.check_schema({"type": 12})
+        self.assertFalse(init.called)
+        self.assertIs(Draft4Validator._meta_validator, meta_validator)
+
+    def test_each_class_has_its_own(self):
+        Draft3Validator.check_schema({})
+        Draft4Validator.check_schema({})
+        self.assertIs(
+            Draft3Validator._meta_validator.schema,
+            Draft3Validator.META_SCHEMA,
+        )
+        self.assertIs(
+            Draft4Validator._meta_validator.schema,
+            Draft4Validator.META_SCHEMA,
+        )
+
+    def test_threads(self):
+        schemas = [
+            ({"properties": {"foo": {"$ref": "#"}}}, True),
+            ({"not": {"type": [12]}}, False),
+            ({"allOf": [{"minimum": 3}, {"items": {"type": "array"}}]}, True),
+            ({"definitions": {"foo": {"minItems": -1}}}, False),
+        ]
+        failures = []
+
+        def check():
+            for _ in range(50):
+                for schema, valid in schemas:
+                    try:
+                        Draft4Validator.check_schema(schema)
+                    except SchemaError:
+                        if valid:
+                            failures.append(schema)
+                    else:
+                        if not valid:
+                            failures.append(schema)
+
+        threads = [threading.Thread(target=check) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+
+
 class TestValidate(TestCase):
+    def setUp(self):
+        validators._checked_schemas.clear()
+        self.addCleanup(validators._checked_schemas.clear)
+
     def test_draft3_validator_is_chosen(self):
         schema = {"$schema": "http://json-schema.org/draft-03/schema#"}
         with mock.patch.object(Draft3Validator, "check_schema") as chk_schema:
@@ -799,6 +1460,66 @@ class TestValidate(TestCase):
             "(?s)Failed validating u?'.*' in metaschema.*On schema",
         )
 
+    def test_schema_is_checked_once(self):
+        schema = {"type": "integer"}
+        with mock.patch.object(Draft4Validator, "check_schema") as chk_schema:
+            validate(1, schema)
+            validate(2, schema)
+            validate(3, dict(schema))
+        chk_schema.assert_called_once_with(schema)
+
+    def test_changed_schema_is_checked_again(self):
+        schema = {"type": "integer"}
+        validate(1, schema)
+        schema["type"] = "string"
+        with self.assertRaises(ValidationError):
+            validate(1, schema)
+        schema["type"] = 12
+        with self.assertRaises(SchemaError):
+            validate(1, schema)
+
+    def test_invalid_schemas_are_not_remembered(self):
+        for _ in range(2):
+            with self.assertRaises(SchemaError):
+                validate(12, {"type": 12})
+
+    def test_validator_is_reused(self):
+        schema = {"type": "integer"}
+        validate(1, schema)
+        with mock.patch.object(Draft4Validator, "__init__") as init:
+            validate(2, schema)
+            with self.assertRaises(ValidationError):
+                validate("foo", schema)
+        self.assertFalse(init.called)
+
+    def test_reused_validator_is_not_compiled(self):
+        def small(validator, value, instance, schema):
+            # A new subschema each time, as some validator functions create.
+            return validator.descend(instance, {"maximum": value})
+
+        Validator = extend(Draft4Validator, {"small": small})
+        schema = {"small": 3}
+        with mock.patch.object(Validator, "check_schema"):
+            with mock.patch.object(Validator, "compile") as compile:
+                for _ in range(3):
+                    validate(1, schema, cls=Validator)
+                with self.assertRaises(ValidationError):
+                    validate(4, schema, cls=Validator)
+        self.assertFalse(compile.called)
+
+    def test_no_cache(self):
+        schema = {"type": "integer"}
+        with mock.patch.object(Draft4Validator, "check_schema") as chk_schema:
+            validate(1, schema, cache=False)
+            validate(2, schema, cache=False)
+        self.assertEqual(chk_schema.call_count, 2)
+
+    def test_arguments_are_passed_along(self):
+        schema = {"format": "ipv4"}
+        validate("12", schema)
+        with self.assertRaises(ValidationError):
+            validate("12", schema, format_checker=FormatChecker())
+
 
 class TestRefResolver(TestCase):
 
@@ -818,6 +1539,39 @@ class TestRefResolver(TestCase):
                 self.assertEqual(resolved, Draft3Validator.META_SCHEMA)
         self.assertFalse(remote.called)
 
+    def test_meta_schemas_are_shared_rather_than_copied(self):
+        other = RefResolver("", {})
+        self.assertIs(self.resolver.store.base, other.store.base)
+        ref = Draft4Validator.META_SCHEMA["id"]
+        self.assertIs(self.resolver.store[ref], Draft4Validator.META_SCHEMA)
+
+    def test_store_changes_are_not_shared(self):
+        other = RefResolver("", {})
+        ref = Draft4Validator.META_SCHEMA["id"]
+        self.resolver.store["foo://new"] = {}
+        del self.resolver.store[ref]
+        self.assertNotIn(ref, self.resolver.store)
+        self.assertIn(self.stored_uri, self.resolver.store)
+        self.assertIn(ref, other.store)
+        self.assertNotIn("foo://new", other.store)
+        self.assertNotIn(self.stored_uri, other.store)
+
+    def test_store_contents(self):
+        ref = Draft4Validator.META_SCHEMA["id"]
+        store = self.resolver.store
+        self.assertEqual(len(store), len(list(store)))
+        self.assertEqual(
+            set(store),
+            set(store.base) | set([self.base_uri, self.stored_uri]),
+        )
+        store[ref] = {}
+        self.assertEqual(len(store), len(list(store)))
+        self.assertEqual(store[ref], {})
+
+    def test_urljoin_cache_is_shared(self):
+        other = RefResolver("", {})
+        self.assertIs(self.resolver._urljoin_cache, other._urljoin_cache)
+
     def test_it_resolves_local_refs(self):
         ref = "#/properties/foo"
         self.referrer["properties"] = {"foo": object()}
@@ -845,10 +1599,48 @@ class TestRefResolver(TestCase):
         schema = {"baz": 12}
 
         with mock.patch("jsonschema.validators.requests") as requests:
-            requests.get.return_value.json.return_value = schema
+            session = requests.Session.return_value
+            session.get.return_value.json.return_value = schema
             with self.resolver.resolving(ref) as resolved:
                 self.assertEqual(resolved, 12)
-        requests.get.assert_called_once_with("http://bar")
+        session.get.assert_called_once_with(
+            "http://bar", headers={}, timeout=None,
+        )
+
+    def test_requests_session_is_reused(self):
+        with mock.patch("jsonschema.validators.requests") as requests:
+            session = requests.Session.return_value
+            session.get.return_value.json.return_value = {}
+            with self.resolver.resolving("http://foo"):
+                pass
+            with self.resolver.resolving("http://bar"):
+                pass
+        requests.Session.assert_called_once_with()
+        self.assertEqual(session.get.call_count, 2)
+        requests.adapters.HTTPAdapter.assert_called_once_with(max_retries=0)
+
+    def test_requests_options(self):
+        session = mock.Mock()
+        session.get.return_value.json.return_value = {}
+        resolver = RefResolver("", {}, session=session, timeout=2.5)
+        with mock.patch("jsonschema.validators.requests") as requests:
+            with resolver.resolving("http://bar"):
+                pass
+        self.assertFalse(requests.Session.called)
+        session.get.assert_called_once_with(
+            "http://bar", headers={}, timeout=2.5,
+        )
+
+    def test_requests_retries(self):
+        resolver = RefResolver("", {}, retries=3)
+        with mock.patch("jsonschema.validators.requests") as requests:
+            session = requests.Session.return_value
+            session.get.return_value.json.return_value = {}
+            with resolver.resolving("http://bar"):
+                pass
+        adapter = requests.adapters.HTTPAdapter
+        adapter.assert_called_once_with(max_retries=3)
+        session.mount.assert_any_call("https://", adapter.return_value)
 
     def test_it_retrieves_unstored_refs_via_urlopen(self):
         ref = "http://bar#baz"
@@ -862,6 +1654,65 @@ class TestRefResolver(TestCase):
                     self.assertEqual(resolved, 12)
         urlopen.assert_called_once_with("http://bar")
 
+    def test_urlopen_options(self):
+        resolver = RefResolver("", {}, timeout=2.5, retries=2)
+        response = mock.Mock()
+        response.read.return_value = b"{}"
+        with mock.patch("jsonschema.validators.requests", None):
+            with mock.patch("jsonschema.validators.urlopen") as urlopen:
+                urlopen.side_effect = [
+                    URLError("refused"), socket.timeout(), response,
+                ]
+                with resolver.resolving("http://bar") as resolved:
+                    self.assertEqual(resolved, {})
+        self.assertEqual(
+            urlopen.call_args_list, [mock.call("http://bar", timeout=2.5)] * 3,
+        )
+
+    def test_urlopen_gives_up(self):
+        resolver = RefResolver("", {}, retries=1)
+        with mock.patch("jsonschema.validators.requests", None):
+            with mock.patch("jsonschema.validators.urlopen") as urlopen:
+                urlopen.side_effect = URLError("refused")
+                with self.assertRaises(RefResolutionError):
+                    with resolver.resolving("http://bar"):
+                        pass
+        self.assertEqual(urlopen.call_count, 2)
+
+    def test_urlopen_does_not_retry_http_errors(self):
+        resolver = RefResolver("", {}, retries=1)
+        error = HTTPError("http://bar", 404, "Not Found", {}, None)
+        with mock.patch("jsonschema.validators.requests", None):
+            with mock.patch("jsonschema.validators.urlopen") as urlopen:
+                urlopen.side_effect = error
+                with self.assertRaises(RefResolutionError):
+                    with resolver.resolving("http://bar"):
+                        pass
+        self.assertEqual(urlopen.call_count, 1)
+
+    def test_urlopen_from_a_server(self):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(b'{"foo": {"type": "integer"}}')
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        uri = "http://127.0.0.1:%s/schema.json" % (server.server_port,)
+        resolver = RefResolver("", {}, timeout=5)
+        with mock.patch("jsonschema.validators.requests", None):
+            with resolver.resolving(uri + "#/foo") as resolved:
+                self.assertEqual(resolved, {"type": "integer"})
+
     def test_it_can_construct_a_base_uri_from_a_schema(self):
         schema = {"id": "foo"}
         resolver = RefResolver.from_schema(schema)
@@ -926,6 +1777,277 @@ class TestRefResolver(TestCase):
                 pass
         self.assertEqual(str(err.exception), "Oh no! What's this?")
 
+    def test_prefetch(self):
+        documents = {
+            "http://example.com/one.json": {
+                "definitions": {"foo": {"$ref": "two.json"}},
+            },
+            "http://example.com/two.json": {"type": "integer"},
+            "http://example.com/nested/three.json": {
+                "items": {"$ref": "../one.json#/definitions/foo"},
+            },
+        }
+        schema = {
+            "id": "http://example.com/root.json",
+            "properties": {
+                "foo": {"$ref": "one.json#/definitions/foo"},
+                "bar": {"id": "nested/", "$ref": "three.json"},
+                "baz": {"$ref": "#/definitions/baz"},
+                "quux": {"$ref": Draft4Validator.META_SCHEMA["id"]},
+            },
+            "definitions": {"baz": {}},
+        }
+        fetch = mock.Mock(side_effect=documents.__getitem__)
+        resolver = RefResolver.from_schema(schema)
+        resolver.prefetch(fetch=fetch)
+
+        self.assertEqual(
+            sorted(call[0][0] for call in fetch.call_args_list),
+            sorted(documents),
+        )
+        for uri, document in documents.items():
+            self.assertIs(resolver.store[uri], document)
+
+        validator = Draft4Validator(schema, resolver=resolver)
+        with mock.patch.object(resolver, "resolve_remote") as remote:
+            validator.validate({"foo": 1, "bar": [2], "quux": {}})
+            self.assertFalse(validator.is_valid({"bar": ["3"]}))
+        self.assertFalse(remote.called)
+
+    def test_prefetch_nothing_remote(self):
+        fetch = mock.Mock()
+        RefResolver("", {"$ref": "#/definitions/foo"}).prefetch(fetch=fetch)
+        self.assertFalse(fetch.called)
+
+    def test_prefetch_uses_resolve_remote(self):
+        resolver = RefResolver(
+            "", {"$ref": "foo://bar"}, handlers={"foo": lambda uri: {}},
+        )
+        with mock.patch.object(
+            resolver, "resolve_remote", wraps=resolver.resolve_remote,
+        ) as remote:
+            resolver.prefetch()
+        remote.assert_called_once_with("foo://bar")
+        self.assertEqual(resolver.store["foo://bar"], {})
+
+    def test_prefetch_respects_max_store_size(self):
+        documents = {
+            "foo://a": {"$ref": "foo://b"},
+            "foo://b": {"$ref": "foo://c"},
+            "foo://c": {},
+        }
+        for fetch in None, documents.__getitem__:
+            resolver = RefResolver(
+                "",
+                {"$ref": "foo://a"},
+                handlers={"foo": documents.__getitem__},
+                max_store_size=2,
+            )
+            resolver.prefetch(fetch=fetch)
+            self.assertNotIn("foo://a", resolver.store)
+            self.assertIn("foo://b", resolver.store)
+            self.assertIn("foo://c", resolver.store)
+            stats = resolver.cache_stats()["store"]
+            self.assertEqual(stats["remote_documents"], 2)
+            self.assertEqual(stats["evictions"], 1)
+
+    def test_prefetch_failure(self):
+        fetch = mock.Mock(side_effect=ValueError("Oh no!"))
+        resolver = RefResolver("", {"$ref": "foo://bar"})
+        with self.assertRaises(RefResolutionError) as err:
+            resolver.prefetch(fetch=fetch)
+        self.assertEqual(str(err.exception), "Oh no!")
+
+    def test_fresh_documents_in_persistent_cache_are_used(self):
+        cache = mock.Mock()
+        cache.get.return_value = CachedDocument({"foo": 12}, None, True)
+        foo_handler = mock.Mock()
+        resolver = RefResolver(
+            "", {}, handlers={"foo": foo_handler}, persistent_cache=cache,
+        )
+        with resolver.resolving("foo://bar") as resolved:
+            self.assertEqual(resolved, {"foo": 12})
+        cache.get.assert_called_once_with("foo://bar")
+        self.assertFalse(foo_handler.called)
+        self.assertFalse(cache.set.called)
+
+    def test_retrieved_documents_are_persisted(self):
+        cache = mock.Mock()
+        cache.get.return_value = None
+        foo_handler = mock.Mock(return_value={"foo": 12})
+        resolver = RefResolver(
+            "", {}, handlers={"foo": foo_handler}, persistent_cache=cache,
+        )
+        with resolver.resolving("foo://bar") as resolved:
+            self.assertEqual(resolved, {"foo": 12})
+        cache.set.assert_called_once_with("foo://bar", {"foo": 12}, etag=None)
+
+    def test_stale_documents_are_revalidated(self):
+        cache = mock.Mock()
+        cache.get.return_value = CachedDocument({"foo": 12}, "abc", False)
+        session = mock.Mock()
+        session.get.return_value.status_code = 304
+        session.get.return_value.headers = {}
+        resolver = RefResolver(
+            "", {}, persistent_cache=cache, session=session,
+        )
+        with mock.patch("jsonschema.validators.requests"):
+            with resolver.resolving("http://bar") as resolved:
+                self.assertEqual(resolved, {"foo": 12})
+        session.get.assert_called_once_with(
+            "http://bar", headers={"If-None-Match": "abc"}, timeout=None,
+        )
+        cache.set.assert_called_once_with(
+            "http://bar", {"foo": 12}, etag="abc",
+        )
+
+    def test_changed_stale_documents_are_retrieved(self):
+        cache = mock.Mock()
+        cache.get.return_value = CachedDocument({"foo": 12}, "abc", False)
+        session = mock.Mock()
+        resolver = RefResolver(
+            "", {}, persistent_cache=cache, session=session,
+        )
+        with mock.patch("jsonschema.validators.requests"):
+            response = session.get.return_value
+            response.status_code = 200
+            response.headers = {"ETag": "def"}
+            response.json.return_value = {"foo": 13}
+            with resolver.resolving("http://bar") as resolved:
+                self.assertEqual(resolved, {"foo": 13})
+        cache.set.assert_called_once_with(
+            "http://bar", {"foo": 13}, etag="def",
+        )
+
+    def test_cache_sizes(self):
+        resolver = RefResolver(
+            "", {}, urljoin_cache_size=10, remote_cache_size=None,
+        )
+        self.assertIsNot(resolver._urljoin_cache, self.resolver._urljoin_cache)
+        stats = resolver.cache_stats()
+        self.assertEqual(stats["urljoin"]["maxsize"], 10)
+        self.assertEqual(stats["remote"]["maxsize"], None)
+
+    def test_cache_stats(self):
+        foo_handler = mock.Mock(return_value={"bar": {"baz": 12}})
+        resolver = RefResolver(
+            "", {"a": 1}, handlers={"foo": foo_handler}, remote_cache_size=1,
+        )
+        self.assertEqual(
+            resolver.cache_stats()["remote"],
+            dict(hits=0, misses=0, evictions=0, size=0, maxsize=1),
+        )
+        for ref in "foo://x#/bar", "foo://x#/bar", "foo://x#/bar/baz":
+            with resolver.resolving(ref):
+                pass
+
+        stats = resolver.cache_stats()
+        self.assertEqual(
+            stats["remote"],
+            dict(hits=1, misses=2, evictions=1, size=1, maxsize=1),
+        )
+        self.assertEqual(
+            stats["store"],
+            dict(
+                documents=2,
+                remote_documents=1,
+                evictions=0,
+                bytes=len(json.dumps({"a": 1})) + len(
+                    json.dumps({"bar": {"baz": 12}}),
+                ),
+            ),
+        )
+
+    def test_cache_stats_count_documents_held_for_their_fragments(self):
+        document = {"foo": [1, 2, 3]}
+        resolver = RefResolver("", {})
+        resolver.resolve_fragment(document, u"/foo")
+        self.assertEqual(
+            resolver.cache_stats()["store"]["bytes"],
+            len(json.dumps({})) + len(json.dumps(document)),
+        )
+
+    def test_cache_stats_measure_each_document_once(self):
+        resolver = RefResolver("", {"a": 1})
+        resolver.cache_stats()
+        with mock.patch.object(_utils, "fingerprint") as fingerprint:
+            stats = resolver.cache_stats()
+        self.assertFalse(fingerprint.called)
+        self.assertEqual(stats["store"]["bytes"], len(json.dumps({"a": 1})))
+
+    def test_cache_stats_do_not_count_meta_schemas(self):
+        resolver = RefResolver("", {})
+        del resolver.store[u"http://json-schema.org/draft-04/schema"]
+        self.assertEqual(
+            resolver.cache_stats()["store"]["bytes"], len(json.dumps({})),
+        )
+
+    def test_max_store_size(self):
+        foo_handler = mock.Mock(side_effect=lambda uri: {"uri": uri})
+        resolver = RefResolver(
+            "",
+            {},
+            store={"foo://stored": {}},
+            handlers={"foo": foo_handler},
+            max_store_size=2,
+        )
+        for ref in "foo://a", "foo://b", "foo://c":
+            with resolver.resolving(ref):
+                pass
+
+        self.assertNotIn("foo://a", resolver.store)
+        self.assertEqual(resolver.store["foo://b"], {"uri": "foo://b"})
+        self.assertEqual(resolver.store["foo://c"], {"uri": "foo://c"})
+        self.assertIn("foo://stored", resolver.store)
+        self.assertIs(resolver.store.base, self.resolver.store.base)
+        stats = resolver.cache_stats()["store"]
+        self.assertEqual(stats["remote_documents"], 2)
+        self.assertEqual(stats["evictions"], 1)
+
+    def test_resolve_fragment(self):
+        document = {u"a": [{u"0": {u"b/c": 12}}, 13]}
+        resolver = RefResolver("", document)
+        self.assertEqual(
+            resolver.resolve_fragment(document, u"/a/0/0/b~1c"), 12,
+        )
+        self.assertEqual(resolver.resolve_fragment(document, u"a/1"), 13)
+        with self.assertRaises(RefResolutionError) as e:
+            resolver.resolve_fragment(document, u"/a/2")
+        self.assertIn("'a/2'", str(e.exception))
+
+    def test_resolved_fragments_are_remembered(self):
+        document = {u"a": {u"b": {u"c": 12}}}
+        resolver = RefResolver("", document)
+        resolver.resolve_fragment(document, u"/a/b/c")
+        with mock.patch.object(_utils, "parse_pointer") as parse_pointer:
+            found = resolver.resolve_fragment(document, u"/a/b/c")
+        self.assertEqual(found, 12)
+        self.assertFalse(parse_pointer.called)
+        self.assertEqual(resolver.resolve_fragment({}, u""), {})
+
+    def test_resolved_fragments_are_bounded(self):
+        resolver = RefResolver("", {}, remote_cache_size=2)
+        documents = [{u"a": i} for i in range(3)]
+        for document in documents:
+            resolver.resolve_fragment(document, u"/a")
+        self.assertEqual(len(resolver._fragments), 2)
+        self.assertIsNone(resolver._fragments.get(id(documents[0])))
+
+    def test_evicted_documents_are_not_kept_for_their_fragments(self):
+        foo_handler = mock.Mock(side_effect=lambda uri: {u"uri": uri})
+        resolver = RefResolver(
+            "", {}, handlers={"foo": foo_handler}, max_store_size=1,
+        )
+        with resolver.resolving("foo://a#/uri"):
+            pass
+        a = resolver.store["foo://a"]
+        with resolver.resolving("foo://b#/uri"):
+            pass
+        self.assertIsNone(resolver._fragments.get(id(a)))
+        self.assertIsNotNone(
+            resolver._fragments.get(id(resolver.store["foo://b"])),
+        )
+
     def test_helpful_error_message_on_failed_pop_scope(self):
         resolver = RefResolver("", {})
         resolver.pop_scope()
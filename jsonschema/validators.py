@@ -1,17 +1,25 @@
 from __future__ import division
 
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+import abc
 import contextlib
+import copy
+import itertools
 import json
 import numbers
+import re
+import socket
+import threading
 
 try:
     import requests
 except ImportError:
     requests = None
 
-from jsonschema import _utils, _validators
+from jsonschema import _predicates, _utils, _validators
 from jsonschema.compat import (
-    Sequence, urljoin, urlsplit, urldefrag, unquote, urlopen,
+    HTTPError, Sequence, URLError, urljoin, urlsplit, urldefrag, urlopen,
     str_types, int_types, iteritems, lru_cache,
 )
 from jsonschema.exceptions import RefResolutionError, SchemaError, UnknownType
@@ -27,6 +35,17 @@ _unset = _utils.Unset()
 
 validators = {}
 meta_schemas = _utils.URIDict()
+_meta_schema_store = None
+_URLJOIN_CACHE_SIZE = 1024
+_urljoin_cache = lru_cache(_URLJOIN_CACHE_SIZE)(urljoin)
+
+_checked_schemas = _utils.LRUCache(maxsize=128)
+_cached_validators = _utils.LRUCache(maxsize=32)
+
+# The Python types which deserialized JSON is made of.
+_JSON_PYTYPES = frozenset(
+    (bool, dict, float, list, type(None), type(u""), str) + int_types,
+)
 
 
 def validates(version):
@@ -49,9 +68,11 @@ def validates(version):
     """
 
     def _validates(cls):
+        global _meta_schema_store
         validators[version] = cls
         if u"id" in cls.META_SCHEMA:
             meta_schemas[cls.META_SCHEMA[u"id"]] = cls
+            _meta_schema_store = None
         return cls
     return _validates
 
@@ -68,59 +89,113 @@ def create(meta_schema, validators=(), version=None, default_types=None):
         VALIDATORS = dict(validators)
         META_SCHEMA = dict(meta_schema)
         DEFAULT_TYPES = dict(default_types)
+        _DEFAULT_TYPE_CHECKS = dict(DEFAULT_TYPES), _type_checks(DEFAULT_TYPES)
 
         def __init__(
-            self, schema, types=(), resolver=None, format_checker=None,
+            self,
+            schema,
+            types=(),
+            resolver=None,
+            format_checker=None,
+            max_errors=None,
+            fail_fast=False,
         ):
+            if fail_fast:
+                max_errors = 1
+            elif max_errors is not None and max_errors < 1:
+                raise ValueError("max_errors must be at least 1")
+
             self._types = dict(self.DEFAULT_TYPES)
             self._types.update(types)
 
+            default_types, type_checks = self._DEFAULT_TYPE_CHECKS
+            if self._types != default_types:
+                type_checks = _type_checks(self._types)
+            self._type_checks = type_checks
+
             if resolver is None:
                 resolver = RefResolver.from_schema(schema)
 
             self.resolver = resolver
             self.format_checker = format_checker
+            self.max_errors = max_errors
             self.schema = schema
 
+            self._compiled = None
+            self._precomputed = None
+            self._regexes = {}
+
         @classmethod
         def check_schema(cls, schema):
-            for error in cls(cls.META_SCHEMA).iter_errors(schema):
+            # A single compiled validator for the meta schema is shared by
+            # each class.
+            meta_validator = vars(cls).get("_meta_validator")
+            if (
+                meta_validator is None or
+                meta_validator.schema is not cls.META_SCHEMA
+            ):
+                meta_validator = cls(cls.META_SCHEMA).compile()
+                cls._meta_validator = meta_validator
+
+            for error in meta_validator.iter_errors(schema):
                 raise SchemaError.create_from(error)
 
         def iter_errors(self, instance, _schema=None):
             if _schema is None:
-                _schema = self.schema
-
-            scope = _schema.get(u"id")
-            if scope:
-                self.resolver.push_scope(scope)
-            try:
-                ref = _schema.get(u"$ref")
-                if ref is not None:
-                    validators = [(u"$ref", ref)]
-                else:
-                    validators = iteritems(_schema)
-
-                for k, v in validators:
-                    validator = self.VALIDATORS.get(k)
-                    if validator is None:
-                        continue
-
-                    errors = validator(self, v, instance, _schema) or ()
-                    for error in errors:
-                        # set details if not already set by the called fn
-                        error._set(
-                            validator=k,
-                            validator_value=v,
-                            instance=instance,
-                            schema=_schema,
-                        )
-                        if k != u"$ref":
-                            error.schema_path.appendleft(k)
-                        yield error
-            finally:
-                if scope:
-                    self.resolver.pop_scope()
+                errors = self._iter_errors(instance, self.schema)
+                if self.max_errors is not None:
+                    errors = itertools.islice(errors, self.max_errors)
+                return errors
+            return self._iter_errors(instance, _schema)
+
+        def _iter_errors(self, instance, schema):
+            if self._compiled is None:
+                return _iter_errors(self, instance, schema)
+            iter_errors, _ = self._compiled_for(schema)
+            return iter_errors(instance)
+
+        def compile(self):
+            """
+            Return a copy of this validator which compiles each schema it
+            visits only once, rather than once per instance.
+
+            Subschemas are compiled lazily as validation reaches them, and
+            are assumed not to be mutated afterwards.
+
+            """
+
+            compiled = copy.copy(self)
+            compiled._compiled = {}
+            compiled._precomputed = {}
+            return compiled
+
+        def _compiled_for(self, schema):
+            compiled = self._compiled.get(id(schema))
+            if compiled is None:
+                compiled = self._compiled[id(schema)] = _compile(self, schema)
+            return compiled
+
+        def _precompute(self, fn, thing):
+            """
+            Return ``fn(self, thing)``, computing it only once if compiled.
+
+            """
+
+            if self._precomputed is None:
+                return fn(self, thing)
+
+            key = fn, id(thing)
+            precomputed = self._precomputed.get(key)
+            if precomputed is None:
+                # Hold on to thing so that its id cannot be reused
+                precomputed = self._precomputed[key] = thing, fn(self, thing)
+            return precomputed[1]
+
+        def _regex(self, pattern):
+            regex = self._regexes.get(pattern)
+            if regex is None:
+                regex = self._regexes[pattern] = re.compile(pattern)
+            return regex
 
         def descend(self, instance, schema, path=None, schema_path=None):
             for error in self.iter_errors(instance, schema):
@@ -135,6 +210,12 @@ def create(meta_schema, validators=(), version=None, default_types=None):
                 raise error
 
         def is_type(self, instance, type):
+            checks = self._type_checks.get(type)
+            if checks is not None:
+                is_type = checks.get(instance.__class__)
+                if is_type is not None:
+                    return is_type
+
             if type not in self._types:
                 raise UnknownType(type, instance, self.schema)
             pytypes = self._types[type]
@@ -150,16 +231,383 @@ def create(meta_schema, validators=(), version=None, default_types=None):
             return isinstance(instance, pytypes)
 
         def is_valid(self, instance, _schema=None):
-            error = next(self.iter_errors(instance, _schema), None)
-            return error is None
+            if _schema is None:
+                _schema = self.schema
+            if self._compiled is None:
+                return _is_valid(self, instance, _schema)
+            _, is_valid = self._compiled_for(_schema)
+            return is_valid(instance)
 
     if version is not None:
         Validator = validates(version)(Validator)
         Validator.__name__ = version.title().replace(" ", "") + "Validator"
+        Validator.__qualname__ = Validator.__name__
 
     return Validator
 
 
+def _type_checks(types):
+    """
+    Precompute which JSON types each builtin JSON Python type is.
+
+    Returns a mapping from each JSON type name in ``types`` to a mapping from
+    the exact Python types in ``_JSON_PYTYPES`` to whether their instances are
+    of that JSON type. Types whose Python types check instances other than by
+    their class (or which aren't valid for :func:`isinstance` at all) are left
+    out, as are instances of other Python types, which must be checked using
+    :func:`isinstance` as usual.
+
+    """
+
+    checks = {}
+    for name, pytypes in iteritems(types):
+        flattened = _utils.flatten(pytypes)
+        if not all(type(each) in (type, abc.ABCMeta) for each in flattened):
+            continue
+
+        is_number = any(
+            issubclass(pytype, numbers.Number) for pytype in flattened
+        )
+        checks[name] = dict(
+            (pytype, issubclass(pytype, flattened)) for pytype in _JSON_PYTYPES
+        )
+        # bool inherits from int, so ensure bools aren't reported as ints
+        if is_number and bool not in flattened:
+            checks[name][bool] = False
+    return checks
+
+
+def _keywords(schema):
+    ref = schema.get(u"$ref")
+    if ref is not None:
+        return [(u"$ref", ref)]
+    return iteritems(schema)
+
+
+def _iter_errors(validator, instance, schema):
+    """
+    Lazily yield the errors in ``instance`` under ``schema``.
+
+    Used by uncompiled validators, which look up the function for each keyword
+    each time, rather than compiling ``schema`` only to throw it away.
+
+    """
+
+    scope = schema.get(u"id")
+    if scope:
+        validator.resolver.push_scope(scope)
+    try:
+        for k, v in _keywords(schema):
+            fn = validator.VALIDATORS.get(k)
+            if fn is None:
+                continue
+
+            errors = fn(validator, v, instance, schema) or ()
+            for error in errors:
+                # set details if not already set by the called fn
+                error._set(
+                    validator=k,
+                    validator_value=v,
+                    instance=instance,
+                    schema=schema,
+                )
+                if k != u"$ref":
+                    error.schema_path.appendleft(k)
+                yield error
+    finally:
+        if scope:
+            validator.resolver.pop_scope()
+
+
+def _is_valid(validator, instance, schema):
+    """
+    Check whether ``instance`` is valid under ``schema`` without any errors.
+
+    The uncompiled counterpart of :func:`_iter_errors`.
+
+    """
+
+    scope = schema.get(u"id")
+    if scope:
+        validator.resolver.push_scope(scope)
+    try:
+        for k, v in _keywords(schema):
+            fn = validator.VALIDATORS.get(k)
+            if fn is None:
+                continue
+
+            predicate = _PREDICATES.get(fn)
+            if predicate is None:
+                errors = fn(validator, v, instance, schema) or ()
+                if next(iter(errors), None) is not None:
+                    return False
+            elif not predicate(validator, v, instance, schema):
+                return False
+        return True
+    finally:
+        if scope:
+            validator.resolver.pop_scope()
+
+
+def _compile(validator, schema):
+    """
+    Bind the keyword dispatch for a single ``schema`` node.
+
+    Returns a pair of callables which respectively lazily yield the errors in
+    an instance under ``schema``, and check whether an instance is valid under
+    it without creating any errors, calling only the keyword functions that
+    ``schema`` actually contains.
+
+    Only compiled validators use this, since the work done here up front
+    (such as grouping keywords by the type of instance they apply to) only
+    pays off when the result is reused.
+
+    """
+
+    scope = schema.get(u"id")
+    checks = []
+    for k, v in _keywords(schema):
+        fn = validator.VALIDATORS.get(k)
+        if fn is not None:
+            if (
+                fn is _validators.ref and
+                isinstance(validator.resolver, RefResolver)
+            ):
+                fn, predicate = _linked_ref()
+            else:
+                predicate = _PREDICATES.get(fn) or _predicate_from(fn)
+            checks.append((k, v, fn, predicate, _INSTANCE_TYPES.get(fn)))
+    _fuse_object_properties(checks)
+
+    if any(instance_type is not None for _, _, _, _, instance_type in checks):
+        applicable = {}
+
+        def checks_for(instance):
+            cls = instance.__class__
+            found = applicable.get(cls)
+            if found is None:
+                if cls not in _JSON_PYTYPES:
+                    return checks
+                found = applicable[cls] = _applicable(validator, checks, cls)
+            return found
+    else:
+        def checks_for(instance):
+            return checks
+
+    def iter_errors(instance):
+        if scope:
+            validator.resolver.push_scope(scope)
+        try:
+            for k, v, fn, _, _ in checks_for(instance):
+                errors = fn(validator, v, instance, schema) or ()
+                for error in errors:
+                    # set details if not already set by the called fn
+                    error._set(
+                        validator=k,
+                        validator_value=v,
+                        instance=instance,
+                        schema=schema,
+                    )
+                    if k != u"$ref":
+                        error.schema_path.appendleft(k)
+                    yield error
+        finally:
+            if scope:
+                validator.resolver.pop_scope()
+
+    def is_valid(instance):
+        if scope:
+            validator.resolver.push_scope(scope)
+        try:
+            for _, v, _, predicate, _ in checks_for(instance):
+                if not predicate(validator, v, instance, schema):
+                    return False
+            return True
+        finally:
+            if scope:
+                validator.resolver.pop_scope()
+
+    return iter_errors, is_valid
+
+
+def _fuse_object_properties(checks):
+    """
+    Check the properties of objects for each property keyword at once.
+
+    If ``checks`` has ``patternProperties`` or more than one of the keywords
+    which look at each property of an instance, they are replaced (only when
+    checking validity) by a single check which looks at each property once.
+    Errors are still found by each keyword separately, in the same order.
+
+    Like the rest of :func:`_compile`, this is done only for compiled
+    validators, since it costs more than it saves for a single call.
+
+    """
+
+    fusable = [
+        (index, _FUSABLE[check[2]])
+        for index, check in enumerate(checks)
+        if check[2] in _FUSABLE
+    ]
+    keywords = frozenset(keyword for _, keyword in fusable)
+    if len(keywords) < 2 and u"patternProperties" not in keywords:
+        return
+
+    def fused(validator, value, instance, schema):
+        return _predicates.object_properties(
+            validator, keywords, instance, schema,
+        )
+
+    for index, _ in fusable:
+        k, v, fn, _, instance_type = checks[index]
+        checks[index] = k, v, fn, _already_checked, instance_type
+    k, v, fn, _, instance_type = checks[fusable[0][0]]
+    checks[fusable[0][0]] = k, v, fn, fused, instance_type
+
+
+def _already_checked(validator, value, instance, schema):
+    return True
+
+
+def _applicable(validator, checks, cls):
+    """
+    Select the checks which can fail for instances of the builtin type ``cls``.
+
+    Keyword functions which apply only to some other JSON type are left out.
+    Each compiled schema node keeps the selection for each ``cls`` it sees.
+
+    """
+
+    type_checks = validator._type_checks
+    return [
+        check for check in checks
+        if check[-1] is None or type_checks.get(check[-1], {}).get(cls, True)
+    ]
+
+
+def _linked_ref():
+    """
+    Create a pair of functions for a single compiled :validator:`$ref`.
+
+    Rather than joining and resolving the reference each time it is followed,
+    they remember, for each resolution scope it is followed from, the
+    subschema it refers to and the scope to validate that subschema in.
+
+    """
+
+    links = {}
+
+    def follow(validator, ref):
+        resolver = validator.resolver
+        scope = resolver.resolution_scope
+        link = links.get(scope)
+        if link is None:
+            url, resolved = resolver.resolve(ref)
+            with resolver.in_scope(url):
+                link = links[scope] = resolver.resolution_scope, resolved
+        return link
+
+    def ref(validator, ref, instance, schema):
+        scope, resolved = follow(validator, ref)
+        scopes = validator.resolver._scopes_stack
+        scopes.append(scope)
+        try:
+            for error in validator.iter_errors(instance, resolved):
+                yield error
+        finally:
+            scopes.pop()
+
+    def is_valid(validator, ref, instance, schema):
+        scope, resolved = follow(validator, ref)
+        scopes = validator.resolver._scopes_stack
+        scopes.append(scope)
+        try:
+            return validator.is_valid(instance, resolved)
+        finally:
+            scopes.pop()
+
+    return ref, is_valid
+
+
+def _predicate_from(fn):
+    """
+    Turn a validator function without a known boolean counterpart into one.
+
+    """
+
+    def predicate(validator, value, instance, schema):
+        errors = fn(validator, value, instance, schema) or ()
+        return next(iter(errors), None) is None
+    return predicate
+
+
+_PREDICATES = {
+    _validators.additionalItems: _predicates.additionalItems,
+    _validators.additionalProperties: _predicates.additionalProperties,
+    _validators.allOf_draft4: _predicates.allOf_draft4,
+    _validators.anyOf_draft4: _predicates.anyOf_draft4,
+    _validators.dependencies: _predicates.dependencies,
+    _validators.disallow_draft3: _predicates.disallow_draft3,
+    _validators.enum: _predicates.enum,
+    _validators.extends_draft3: _predicates.extends_draft3,
+    _validators.format: _predicates.format,
+    _validators.items: _predicates.items,
+    _validators.maxItems: _predicates.maxItems,
+    _validators.maxLength: _predicates.maxLength,
+    _validators.maxProperties_draft4: _predicates.maxProperties_draft4,
+    _validators.maximum: _predicates.maximum,
+    _validators.minItems: _predicates.minItems,
+    _validators.minLength: _predicates.minLength,
+    _validators.minProperties_draft4: _predicates.minProperties_draft4,
+    _validators.minimum: _predicates.minimum,
+    _validators.multipleOf: _predicates.multipleOf,
+    _validators.not_draft4: _predicates.not_draft4,
+    _validators.oneOf_draft4: _predicates.oneOf_draft4,
+    _validators.pattern: _predicates.pattern,
+    _validators.patternProperties: _predicates.patternProperties,
+    _validators.properties_draft3: _predicates.properties_draft3,
+    _validators.properties_draft4: _predicates.properties_draft4,
+    _validators.ref: _predicates.ref,
+    _validators.required_draft4: _predicates.required_draft4,
+    _validators.type_draft3: _predicates.type_draft3,
+    _validators.type_draft4: _predicates.type_draft4,
+    _validators.uniqueItems: _predicates.uniqueItems,
+}
+
+
+# The keyword functions which _fuse_object_properties combines.
+_FUSABLE = {
+    _validators.additionalProperties: u"additionalProperties",
+    _validators.patternProperties: u"patternProperties",
+    _validators.properties_draft4: u"properties",
+}
+
+
+# The JSON type of instance which each keyword function applies to. Each of
+# them ignores instances of any other type.
+_INSTANCE_TYPES = {
+    _validators.additionalItems: u"array",
+    _validators.additionalProperties: u"object",
+    _validators.dependencies: u"object",
+    _validators.items: u"array",
+    _validators.maxItems: u"array",
+    _validators.maxLength: u"string",
+    _validators.maxProperties_draft4: u"object",
+    _validators.maximum: u"number",
+    _validators.minItems: u"array",
+    _validators.minLength: u"string",
+    _validators.minProperties_draft4: u"object",
+    _validators.minimum: u"number",
+    _validators.multipleOf: u"number",
+    _validators.pattern: u"string",
+    _validators.patternProperties: u"object",
+    _validators.properties_draft3: u"object",
+    _validators.properties_draft4: u"object",
+    _validators.required_draft4: u"object",
+    _validators.uniqueItems: u"array",
+}
+
+
 def extend(validator, validators, version=None):
     all_validators = dict(validator.VALIDATORS)
     all_validators.update(validators)
@@ -264,12 +712,66 @@ class RefResolver(object):
         urljoin_cache (functools.lru_cache):
 
             A cache that will be used for caching the results of joining
-            the resolution scope to subscopes.
+            the resolution scope to subscopes. If unprovided, one shared by
+            all resolvers will be used.
 
         remote_cache (functools.lru_cache):
 
             A cache that will be used for caching the results of
-            resolved remote URLs.
+            resolved remote URLs. If unprovided, one will be created when
+            a reference is first resolved.
+
+        persistent_cache:
+
+            A cache of retrieved remote documents which outlives the
+            resolver (such as a :class:`jsonschema.cache.DirectoryCache`),
+            and which will be consulted before retrieving any document
+
+        session (requests.Session):
+
+            A session to retrieve remote documents over HTTP(S) with when
+            ``requests`` is available, which may be configured (e.g. with a
+            ``requests.adapters.HTTPAdapter``) to limit connections per host.
+            If unprovided, the resolver will create its own the first time it
+            needs one, so that connections are reused
+
+        timeout (float):
+
+            The number of seconds to wait for a remote server before giving
+            up on retrieving a document. If unprovided, wait indefinitely
+
+        retries (int):
+
+            How many times to retry retrieving a document from a server which
+            could not be connected to
+
+        urljoin_cache_size (int):
+
+            The number of joined URLs to cache (least recently used first) if
+            no ``urljoin_cache`` is provided, where ``None`` means unbounded.
+            Resolvers using the default size share one cache (and so report
+            the same statistics for it from :meth:`cache_stats`)
+
+        remote_cache_size (int):
+
+            The number of resolved URLs to cache (least recently used first)
+            if no ``remote_cache`` is provided, and the number of documents
+            to remember resolved fragments within, where ``None`` means
+            unbounded
+
+        max_store_size (int):
+
+            The maximum number of retrieved remote documents to keep in the
+            :attr:`store` when ``cache_remote`` is True, after which the least
+            recently retrieved are removed (along with the fragments resolved
+            within them). If unprovided, all are kept
+
+    The meta schemas of each registered validator are always available in the
+    :attr:`store`, which shares them with other resolvers rather than copying
+    them.
+
+    Each thread tracks its own resolution scope, so a resolver (along with the
+    validators using it) may be used from many threads at once.
 
     """
 
@@ -282,26 +784,45 @@ class RefResolver(object):
         handlers=(),
         urljoin_cache=None,
         remote_cache=None,
+        persistent_cache=None,
+        session=None,
+        timeout=None,
+        retries=0,
+        urljoin_cache_size=_URLJOIN_CACHE_SIZE,
+        remote_cache_size=1024,
+        max_store_size=None,
     ):
         if urljoin_cache is None:
-            urljoin_cache = lru_cache(1024)(urljoin)
-        if remote_cache is None:
-            remote_cache = lru_cache(1024)(self.resolve_from_url)
+            if urljoin_cache_size == _URLJOIN_CACHE_SIZE:
+                urljoin_cache = _urljoin_cache
+            else:
+                urljoin_cache = lru_cache(urljoin_cache_size)(urljoin)
 
         self.referrer = referrer
         self.cache_remote = cache_remote
         self.handlers = dict(handlers)
-
-        self._scopes_stack = [base_uri]
-        self.store = _utils.URIDict(
-            (id, validator.META_SCHEMA)
-            for id, validator in iteritems(meta_schemas)
-        )
+        self.persistent_cache = persistent_cache
+        self.session = session
+        self.timeout = timeout
+        self.retries = retries
+
+        self._base_scope = base_uri
+        self._scopes = threading.local()
+        self.store = _utils.LayeredURIDict(base=_shared_meta_schema_store())
         self.store.update(store)
         self.store[base_uri] = referrer
 
         self._urljoin_cache = urljoin_cache
         self._remote_cache = remote_cache
+        self._remote_cache_size = remote_cache_size
+
+        self._fragments = _utils.LRUCache(maxsize=remote_cache_size)
+
+        self.max_store_size = max_store_size
+        self._remote_uris = OrderedDict()
+        self._store_evictions = 0
+        self._store_lock = threading.Lock()
+        self._document_sizes = {}
 
     @classmethod
     def from_schema(cls, schema, *args, **kwargs):
@@ -322,6 +843,22 @@ class RefResolver(object):
 
         return cls(schema.get(u"id", u""), schema, *args, **kwargs)
 
+    @property
+    def _scopes_stack(self):
+        """
+        The resolution scopes entered by the current thread.
+
+        Each thread has its own, so that a resolver (and the validators which
+        use it) can be used by many threads at once.
+
+        """
+
+        try:
+            return self._scopes.stack
+        except AttributeError:
+            stack = self._scopes.stack = [self._base_scope]
+            return stack
+
     def push_scope(self, scope):
         self._scopes_stack.append(
             self._urljoin_cache(self.resolution_scope, scope),
@@ -377,6 +914,10 @@ class RefResolver(object):
 
     def resolve(self, ref):
         url = self._urljoin_cache(self.resolution_scope, ref)
+        if self._remote_cache is None:
+            self._remote_cache = lru_cache(self._remote_cache_size)(
+                self.resolve_from_url,
+            )
         return url, self._remote_cache(url)
 
     def resolve_from_url(self, url):
@@ -395,6 +936,9 @@ class RefResolver(object):
         """
         Resolve a ``fragment`` within the referenced ``document``.
 
+        The result is remembered, so documents should not be changed once
+        fragments within them have been resolved.
+
         Arguments:
 
             document:
@@ -407,26 +951,98 @@ class RefResolver(object):
 
         """
 
-        fragment = fragment.lstrip(u"/")
-        parts = unquote(fragment).split(u"/") if fragment else []
-
-        for part in parts:
-            part = part.replace(u"~1", u"/").replace(u"~0", u"~")
-
-            if isinstance(document, Sequence):
-                # Array indexes should be turned into integers
-                try:
-                    part = int(part)
-                except ValueError:
-                    pass
+        # Hold on to document so that its id cannot be reused
+        _, resolved = self._fragments.get(id(document), (None, None))
+        if resolved is None:
+            resolved = {}
+            self._fragments[id(document)] = document, resolved
+        elif fragment in resolved:
+            return resolved[fragment]
+
+        target = document
+        for part, index in _utils.parse_pointer(fragment):
+            # Array indexes should be turned into integers
+            if index is not None and isinstance(target, Sequence):
+                part = index
             try:
-                document = document[part]
+                target = target[part]
             except (TypeError, LookupError):
                 raise RefResolutionError(
-                    "Unresolvable JSON pointer: %r" % fragment
+                    "Unresolvable JSON pointer: %r" % fragment.lstrip(u"/")
                 )
 
-        return document
+        resolved[fragment] = target
+        return target
+
+    def prefetch(self, fetch=None, workers=8):
+        """
+        Retrieve every remote document the referrer refers to, concurrently.
+
+        The referrer is scanned for references to documents which are not
+        already in the :attr:`store`, which are then retrieved at once using
+        a pool of threads and added to it. Any further references in those
+        documents are retrieved in the same way, so that resolving
+        references while validating needs no further I/O. Like any other
+        retrieved document, they are kept in the :attr:`store` subject to
+        ``max_store_size``.
+
+        Since this blocks until all documents have been retrieved, when
+        using an event loop it should be run in an executor (e.g. using
+        :meth:`asyncio.AbstractEventLoop.run_in_executor`).
+
+        Arguments:
+
+            fetch (callable):
+
+                A function which will be called (from multiple threads) with
+                each URI to retrieve, and should return the document at that
+                URI. If unprovided, :meth:`resolve_remote` is used
+
+            workers (int):
+
+                The number of documents to retrieve at once
+
+        Raises:
+
+            :exc:`RefResolutionError` if any document could not be retrieved
+
+        """
+
+        # resolve_remote stores what it retrieves itself when cache_remote is
+        # set, and storing it again could bring back evicted documents.
+        store = True
+        if fetch is None:
+            fetch, store = self.resolve_remote, not self.cache_remote
+
+        documents = [(self.resolution_scope, self.referrer)]
+        seen = set()
+        pool = None
+        try:
+            while documents:
+                uris = []
+                for scope, document in documents:
+                    for uri in _remote_refs(scope, document):
+                        if uri not in seen and uri not in self.store:
+                            seen.add(uri)
+                            uris.append(uri)
+                if not uris:
+                    break
+
+                if pool is None:
+                    pool = ThreadPool(workers)
+                try:
+                    retrieved = pool.map(fetch, uris)
+                except Exception as exc:
+                    raise RefResolutionError(exc)
+
+                documents = list(zip(uris, retrieved))
+                if store:
+                    for uri, document in documents:
+                        self._store_remote(uri, document)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
 
     def resolve_remote(self, uri):
         """
@@ -436,6 +1052,12 @@ class RefResolver(object):
         retrieving the document at the specified URI it will be saved in
         the store if :attr:`cache_remote` is True.
 
+        If the resolver has a :attr:`persistent_cache`, a fresh copy of the
+        document found there is used without retrieving it. Otherwise, the
+        retrieved document is stored in it, and if a stale copy was found
+        and has an ``ETag``, it is used to revalidate that copy when using
+        requests_.
+
         .. note::
 
             If the requests_ library is present, ``jsonschema`` will use it to
@@ -459,8 +1081,128 @@ class RefResolver(object):
 
         """
 
+        cached = None
+        if self.persistent_cache is not None:
+            cached = self.persistent_cache.get(uri)
+
+        if cached is not None and cached.fresh:
+            result = cached.document
+        else:
+            result, etag = self._retrieve(uri, cached)
+            if self.persistent_cache is not None:
+                self.persistent_cache.set(uri, result, etag=etag)
+
+        if self.cache_remote:
+            self._store_remote(uri, result)
+        return result
+
+    def _store_remote(self, uri, document):
+        """
+        Add a retrieved document to the store, evicting old ones if needed.
+
+        """
+
+        with self._store_lock:
+            self.store[uri] = document
+            self._remote_uris.pop(uri, None)
+            self._remote_uris[uri] = None
+            if self.max_store_size is None:
+                return
+            while len(self._remote_uris) > self.max_store_size:
+                evicted, _ = self._remote_uris.popitem(last=False)
+                document = self.store.pop(evicted, None)
+                if document is not None:
+                    self._fragments.pop(id(document))
+                self._store_evictions += 1
+
+    def cache_stats(self):
+        """
+        Report on the use of the resolver's caches.
+
+        Returns:
+
+            dict: a mapping with ``"urljoin"`` and ``"remote"`` keys, each
+            describing the corresponding cache's ``hits``, ``misses``,
+            ``evictions``, current ``size`` and ``maxsize`` (or ``None`` if
+            it cannot report them), and a ``"store"`` key describing the
+            number of ``documents`` and ``remote_documents`` held by the
+            :attr:`store` besides the shared meta schemas, how many remote
+            documents have been ``evicted`` from it, and roughly how many
+            ``bytes`` the documents held by the resolver (whether in its
+            :attr:`store` or because fragments within them were resolved)
+            take when serialized as JSON
+
+        Unless the resolver was given its own ``urljoin_cache`` or
+        ``urljoin_cache_size``, the ``"urljoin"`` statistics are for the
+        cache shared by all such resolvers.
+
+        Each document's size is only computed once, since documents are not
+        expected to change once they are in use.
+
+        """
+
+        if self._remote_cache is None:
+            remote = dict(
+                hits=0,
+                misses=0,
+                evictions=0,
+                size=0,
+                maxsize=self._remote_cache_size,
+            )
+        else:
+            remote = _lru_cache_stats(self._remote_cache)
+        stats = dict(
+            urljoin=_lru_cache_stats(self._urljoin_cache), remote=remote,
+        )
+
+        documents = list(self.store.store.values())
+        stats["store"] = dict(
+            documents=len(documents),
+            remote_documents=len(self._remote_uris),
+            evictions=self._store_evictions,
+            bytes=self._held_bytes(documents),
+        )
+        return stats
+
+    def _held_bytes(self, documents):
+        """
+        Roughly measure the documents held by the resolver, besides the
+        shared meta schemas.
+
+        """
+
+        shared = set(
+            id(document) for document in _shared_meta_schema_store().values()
+        )
+        held = dict((id(document), document) for document in documents)
+        held.update(
+            (id(document), document)
+            for document, _ in self._fragments.values()
+        )
+
+        # Sizes are kept (along with their documents, so that their ids are
+        # not reused) only until the next call, so that documents which are
+        # no longer held are not kept alive.
+        sizes, known = {}, self._document_sizes
+        for key, document in iteritems(held):
+            if key in shared:
+                continue
+            size = known.get(key)
+            if size is None:
+                size = document, len(_utils.fingerprint(document) or "")
+            sizes[key] = size
+        self._document_sizes = sizes
+        return sum(size for _, size in sizes.values())
+
+    def _retrieve(self, uri, cached):
+        """
+        Retrieve the document at ``uri`` along with its ``ETag`` (if any).
+
+        """
+
         scheme = urlsplit(uri).scheme
 
+        etag = None
         if scheme in self.handlers:
             result = self.handlers[scheme](uri)
         elif (
@@ -468,19 +1210,110 @@ class RefResolver(object):
             requests and
             getattr(requests.Response, "json", None) is not None
         ):
+            if self.session is None:
+                self.session = _requests_session(retries=self.retries)
+
+            headers = {}
+            if cached is not None and cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+            response = self.session.get(
+                uri, headers=headers, timeout=self.timeout,
+            )
+            etag = response.headers.get("ETag")
+
+            if headers and response.status_code == 304:
+                result, etag = cached.document, etag or cached.etag
             # Requests has support for detecting the correct encoding of
             # json over http
-            if callable(requests.Response.json):
-                result = requests.get(uri).json()
+            elif callable(requests.Response.json):
+                result = response.json()
             else:
-                result = requests.get(uri).json
+                result = response.json
         else:
             # Otherwise, pass off to urllib and assume utf-8
-            result = json.loads(urlopen(uri).read().decode("utf-8"))
+            result = json.loads(self._urlopen(uri).read().decode("utf-8"))
+        return result, etag
 
-        if self.cache_remote:
-            self.store[uri] = result
-        return result
+    def _urlopen(self, uri):
+        kwargs = {}
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+
+        retries = self.retries
+        while True:
+            try:
+                return urlopen(uri, **kwargs)
+            except HTTPError:
+                raise
+            except (URLError, socket.timeout):
+                if retries <= 0:
+                    raise
+                retries -= 1
+
+
+def _lru_cache_stats(cache):
+    cache_info = getattr(cache, "cache_info", None)
+    if cache_info is None:
+        return None
+
+    info = cache_info()
+    return dict(
+        hits=info.hits,
+        misses=info.misses,
+        evictions=info.misses - info.currsize,
+        size=info.currsize,
+        maxsize=info.maxsize,
+    )
+
+
+def _requests_session(retries):
+    """
+    Create a session which retries failed connections ``retries`` times.
+
+    """
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _remote_refs(scope, document):
+    """
+    Find the URIs of the documents referred to from within ``document``.
+
+    """
+
+    stack = [(scope, document)]
+    while stack:
+        scope, node = stack.pop()
+        if isinstance(node, dict):
+            id = node.get(u"id")
+            if isinstance(id, str_types):
+                scope = urljoin(scope, id)
+            ref = node.get(u"$ref")
+            if isinstance(ref, str_types):
+                uri, _ = urldefrag(urljoin(scope, ref))
+                yield uri
+            stack.extend((scope, each) for each in node.values())
+        elif isinstance(node, list):
+            stack.extend((scope, each) for each in node)
+
+
+def _shared_meta_schema_store():
+    """
+    Return a (never modified) store of the registered meta schemas.
+
+    """
+
+    global _meta_schema_store
+    if _meta_schema_store is None:
+        _meta_schema_store = dict(
+            (id, validator.META_SCHEMA)
+            for id, validator in iteritems(meta_schemas)
+        )
+    return _meta_schema_store
 
 
 def validator_for(schema, default=_unset):
@@ -531,6 +1364,18 @@ def validate(instance, schema, cls=None, *args, **kwargs):
     Any other provided positional and keyword arguments will be passed on when
     instantiating the ``cls``.
 
+    Schemas which have already been checked are remembered (along with a
+    validator for them, when no other arguments are given), and are not
+    checked again unless their contents change. Pass ``cache=False`` to check
+    the schema and create a new validator on every call.
+
+    The remembered validators are not compiled (see
+    :meth:`IValidator.compile`), so they hold on to nothing about any
+    subschemas created by validator functions while validating. When
+    validating many instances under one schema, a compiled validator can be
+    faster, but its schema (and every subschema it is used with) must then
+    be neither mutated nor created on the fly.
+
     Raises:
 
         :exc:`ValidationError` if the instance is invalid
@@ -540,7 +1385,25 @@ def validate(instance, schema, cls=None, *args, **kwargs):
     .. rubric:: Footnotes
     .. [#] known by a validator registered with :func:`validates`
     """
+    cache = kwargs.pop("cache", True)
     if cls is None:
         cls = validator_for(schema)
-    cls.check_schema(schema)
-    cls(schema, *args, **kwargs).validate(instance)
+
+    fingerprint = cache and _utils.fingerprint(schema)
+    if not fingerprint:
+        cls.check_schema(schema)
+        cls(schema, *args, **kwargs).validate(instance)
+        return
+
+    if _checked_schemas.get((cls, fingerprint)) is None:
+        cls.check_schema(schema)
+        _checked_schemas[cls, fingerprint] = True
+
+    if args or kwargs:
+        validator = cls(schema, *args, **kwargs)
+    else:
+        key = cls, id(schema), fingerprint
+        validator = _cached_validators.get(key)
+        if validator is None:
+            validator = _cached_validators[key] = cls(schema)
+    validator.validate(instance)